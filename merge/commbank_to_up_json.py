@@ -1,80 +1,178 @@
-import json
 import argparse
+import asyncio
+import os
+import sys
 from datetime import datetime
 import uuid
+from collections import defaultdict, deque
+from operator import itemgetter
+
+import orjson
+import pandas as pd
+
+_EMPTY = {}
+
+# Combined row count above which the transaction join runs through pandas
+FRAME_JOIN_THRESHOLD = 50_000
 
 def load_json_file(filepath):
     """Load JSON data from a file"""
     try:
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
     except Exception as e:
         print(f"Error loading {filepath}: {str(e)}")
         return None
 
-def save_json_file(data, filepath):
-    """Save JSON data to a file"""
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2)
+def save_json_file(data, filepath, pretty=False):
+    """Save JSON data to a file, indented only when pretty is set"""
+    option = orjson.OPT_APPEND_NEWLINE
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+    with open(filepath, 'wb') as f:
+        f.write(orjson.dumps(data, option=option))
     print(f"Saved data to {filepath}")
 
+def input_signature(filepaths):
+    """Return (size, mtime_ns) for each file, or None where it doesn't exist"""
+    signature = []
+    for filepath in filepaths:
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            signature.append(None)
+            continue
+        signature.append([stat.st_size, stat.st_mtime_ns])
+    return signature
+
+def is_cache_current(cache_path, signature, output_paths):
+    """Check whether the outputs were written from inputs matching signature"""
+    if not all(os.path.exists(path) for path in output_paths):
+        return False
+    try:
+        with open(cache_path, 'rb') as f:
+            return orjson.loads(f.read()) == signature
+    except (OSError, orjson.JSONDecodeError):
+        return False
+
+def _cents(value):
+    """
+    Convert an amount value to integer cents so "-12.3" and "-12.30" join.
+    
+    Returns None for amounts that aren't numbers; those transactions never join.
+    """
+    try:
+        return int(round(float(value) * 100))
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+def _join_key(attrs):
+    """Join key for a transaction's attributes: (settled date, amount in cents)"""
+    return (sys.intern(attrs['settledAt'][:10]), _cents((attrs.get('amount') or _EMPTY).get('value', '0')))
+
+def match_transaction_keys(our_keys, upbank_keys):
+    """
+    Pair each of our join keys with the first unused Up Bank key that equals it.
+    
+    Returns a list holding, for each of our keys, the matched Up Bank index or -1.
+    """
+    upbank_lookup = defaultdict(deque)
+    for upbank_index, key in enumerate(upbank_keys):
+        if key[1] is not None:
+            upbank_lookup[key].append(upbank_index)
+    
+    matches = []
+    for key in our_keys:
+        bucket = upbank_lookup.get(key)
+        matches.append(bucket.popleft() if bucket else -1)
+    return matches
+
+def match_transaction_keys_frame(our_keys, upbank_keys):
+    """Vectorised equivalent of match_transaction_keys for large inputs"""
+    columns = ['date', 'cents']
+    ours = pd.DataFrame(our_keys, columns=columns)
+    ours['our_index'] = range(len(ours))
+    upbank = pd.DataFrame(upbank_keys, columns=columns)
+    upbank['upbank_index'] = range(len(upbank))
+    # Keys without an amount never match, as in match_transaction_keys
+    ours = ours[ours['cents'].notna()].astype({'cents': 'int64'})
+    upbank = upbank[upbank['cents'].notna()].astype({'cents': 'int64'})
+    # Number repeated keys on each side so the n-th occurrences pair up, giving
+    # the same one-to-one matches as the FIFO buckets instead of a cross join
+    ours['occurrence'] = ours.groupby(columns, sort=False).cumcount()
+    upbank['occurrence'] = upbank.groupby(columns, sort=False).cumcount()
+    joined = ours.merge(upbank, on=columns + ['occurrence'], how='inner')
+    matches = [-1] * len(our_keys)
+    for our_index, upbank_index in zip(joined['our_index'].tolist(), joined['upbank_index'].tolist()):
+        matches[our_index] = upbank_index
+    return matches
+
 def merge_transactions(our_transactions, upbank_transactions):
     """Merge our transaction data with Up Bank transaction data"""
-    upbank_lookup = {}
     upbank_data = upbank_transactions.get('transactions', []) if isinstance(upbank_transactions, dict) else []
-    for tx in upbank_data:
-        settled_at = tx.get('attributes', {}).get('settledAt', '')
-        if not settled_at:
-            continue
-        tx_date = settled_at.split('T')[0]
-        tx_amount = tx.get('attributes', {}).get('amount', {}).get('value', '0')
-        
-        key = f"{tx_date}_{tx_amount}"
-        if key not in upbank_lookup:
-            upbank_lookup[key] = []
-        upbank_lookup[key].append(tx)
+    # Unsettled Up Bank transactions can't be joined and are dropped up front
+    upbank_settled = [tx for tx in upbank_data
+                      if (tx.get('attributes') or _EMPTY).get('settledAt')]
     
-
-    merged_transactions = []
+    # Output lists hold (settledAt, tx) pairs so the final sort reuses the
+    # keys read during the join
+    our_settled = []
     unmatched_transactions = []
-    
     for our_tx in our_transactions.get('data', []):
-        settled_at = our_tx.get('attributes', {}).get('settledAt', '')
-        if not settled_at:
-            unmatched_transactions.append(our_tx)
+        our_attrs = our_tx.get('attributes') or _EMPTY
+        settled_at = our_attrs.get('settledAt')
+        if settled_at:
+            our_settled.append((settled_at, our_attrs, our_tx))
+        else:
+            unmatched_transactions.append(('', our_tx))
+    
+    our_keys = [_join_key(our_attrs) for _, our_attrs, _ in our_settled]
+    upbank_keys = [_join_key(tx['attributes']) for tx in upbank_settled]
+    if len(our_keys) + len(upbank_keys) >= FRAME_JOIN_THRESHOLD:
+        matches = match_transaction_keys_frame(our_keys, upbank_keys)
+    else:
+        matches = match_transaction_keys(our_keys, upbank_keys)
+    
+    # At most one match per our transaction; trimmed to the matched count below
+    merged_transactions = [None] * len(our_settled)
+    matched_count = 0
+    upbank_matched = [False] * len(upbank_settled)
+    
+    for (settled_at, our_attrs, our_tx), upbank_index in zip(our_settled, matches):
+        if upbank_index < 0:
+            unmatched_transactions.append((settled_at, our_tx))
             continue
-        tx_date = settled_at.split('T')[0]
-        tx_amount = our_tx.get('attributes', {}).get('amount', {}).get('value', '0')
         
-        key = f"{tx_date}_{tx_amount}"
+        up_tx = upbank_settled[upbank_index]
+        up_attrs = up_tx['attributes']
+        upbank_matched[upbank_index] = True
         
-        if key in upbank_lookup and upbank_lookup[key]:
-
-            up_tx = upbank_lookup[key].pop(0)
-            
-
-            merged_tx = up_tx.copy()
-            
-            if 'accountDetails' in our_tx:
-                merged_tx['accountDetails'] = our_tx['accountDetails']
-            
-            if 'category' in our_tx.get('attributes', {}) and 'category' not in up_tx.get('attributes', {}):
-                merged_tx['attributes']['category'] = our_tx['attributes']['category']
-            
-            merged_transactions.append(merged_tx)
-        else:
-            unmatched_transactions.append(our_tx)
+        updates = {}
+        if 'accountDetails' in our_tx:
+            updates['accountDetails'] = our_tx['accountDetails']
+        if 'category' in our_attrs and 'category' not in up_attrs:
+            updates['attributes'] = up_attrs | {'category': our_attrs['category']}
+        
+        # Only copy when something is merged in, and copy attributes too so the
+        # Up Bank record itself is never mutated
+        merged_tx = up_tx | updates if updates else up_tx
+        
+        merged_transactions[matched_count] = (up_attrs['settledAt'], merged_tx)
+        matched_count += 1
     
-    for tx_list in upbank_lookup.values():
-        for tx in tx_list:
-            merged_transactions.append(tx)
+    del merged_transactions[matched_count:]
+    merged_transactions.extend(
+        (tx['attributes']['settledAt'], tx)
+        for tx, matched in zip(upbank_settled, upbank_matched) if not matched
+    )
     
     print(f"Merged transactions: {len(merged_transactions)}")
     print(f"Unmatched transactions from our data: {len(unmatched_transactions)}")
     
-    all_transactions = merged_transactions + unmatched_transactions
-    
-    all_transactions.sort(key=lambda x: x.get('attributes', {}).get('settledAt', ''), reverse=True)
+    # Each list is made of ordered runs, which Timsort merges in close to linear time
+    keyed = merged_transactions + unmatched_transactions
+    keyed.sort(key=itemgetter(0), reverse=True)
+    all_transactions = [tx for _, tx in keyed]
     
     return {
         "data": all_transactions,
@@ -89,19 +187,20 @@ def merge_accounts(our_accounts, upbank_accounts):
     upbank_lookup = {}
     upbank_data = upbank_accounts.get('accounts', []) if isinstance(upbank_accounts, dict) else []
     for account in upbank_data:
-        account_name = account.get('attributes', {}).get('displayName', '')
+        account_name = sys.intern((account.get('attributes') or _EMPTY).get('displayName') or '')
         upbank_lookup[account_name] = account
     
     merged_accounts = []
     
     for our_account in our_accounts.get('data', []):
-        account_name = our_account.get('attributes', {}).get('displayName', '')
+        account_name = sys.intern((our_account.get('attributes') or _EMPTY).get('displayName') or '')
         
         if account_name in upbank_lookup:
             up_account = upbank_lookup.pop(account_name)
             
-            merged_account = up_account.copy()
-            merged_account['attributes']['balance'] = our_account['attributes']['balance']
+            merged_account = up_account | {
+                'attributes': up_account['attributes'] | {'balance': our_account['attributes']['balance']}
+            }
             
             merged_accounts.append(merged_account)
         else:
@@ -120,16 +219,27 @@ def merge_accounts(our_accounts, upbank_accounts):
         }
     }
 
-def main():
+async def main():
     our_transactions_path = 'combined_transactions.json'
     our_accounts_path = 'combined_accounts.json'
     upbank_transactions_path = '../outputs/enriched_all_transactions.json'
     upbank_accounts_path = '../outputs/accounts.json'
     output_transactions_path = 'merged_transactions.json'
     output_accounts_path = 'merged_accounts.json'
+    cache_path = '.merge_cache.json'
     
-    our_transactions = load_json_file(our_transactions_path)
-    our_accounts = load_json_file(our_accounts_path)
+    signature = input_signature([our_transactions_path, our_accounts_path,
+                                 upbank_transactions_path, upbank_accounts_path])
+    if is_cache_current(cache_path, signature, [output_transactions_path, output_accounts_path]):
+        print("Inputs unchanged since last merge, skipping")
+        return
+    
+    our_transactions, our_accounts, upbank_transactions, upbank_accounts = await asyncio.gather(
+        asyncio.to_thread(load_json_file, our_transactions_path),
+        asyncio.to_thread(load_json_file, our_accounts_path),
+        asyncio.to_thread(load_json_file, upbank_transactions_path),
+        asyncio.to_thread(load_json_file, upbank_accounts_path),
+    )
     
     if not our_transactions:
         print(f"Warning: {our_transactions_path} not found. Creating empty transactions data.")
@@ -139,12 +249,10 @@ def main():
         print(f"Warning: {our_accounts_path} not found. Creating empty accounts data.")
         our_accounts = {"data": [], "links": {"prev": None, "next": None}}
     
-    upbank_transactions = load_json_file(upbank_transactions_path)
     if not upbank_transactions:
         print(f"Warning: {upbank_transactions_path} not found. Creating empty transactions data.")
         upbank_transactions = {"data": [], "links": {"prev": None, "next": None}}
     
-    upbank_accounts = load_json_file(upbank_accounts_path)
     if not upbank_accounts:
         print(f"Warning: {upbank_accounts_path} not found. Creating empty accounts data.")
         upbank_accounts = {"data": [], "links": {"prev": None, "next": None}}
@@ -153,8 +261,13 @@ def main():
     
     merged_accounts = merge_accounts(our_accounts, upbank_accounts)
     
-    save_json_file(merged_transactions, output_transactions_path)
-    save_json_file(merged_accounts, output_accounts_path)
+    await asyncio.gather(
+        asyncio.to_thread(save_json_file, merged_transactions, output_transactions_path),
+        asyncio.to_thread(save_json_file, merged_accounts, output_accounts_path),
+    )
+    
+    with open(cache_path, 'wb') as f:
+        f.write(orjson.dumps(signature))
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
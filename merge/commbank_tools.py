@@ -1,29 +1,72 @@
 import os
+import numpy as np
 import pandas as pd
-import csv
 from datetime import datetime, timedelta
-import json
+import orjson
 import uuid
 import re
-from datetime import datetime
-import os
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from financial_planning.helpers import REAL_ACCOUNTS, parse_amounts, parse_dates, read_statement_csv, uuid4_batch
 
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-commbank_dir = os.path.join(project_root, 'commbank_csv')
 
-commbank_dirs = [d for d in os.listdir(commbank_dir) if os.path.isdir(os.path.join(commbank_dir, d)) and re.match(r'\d{2}-\d{2}-\d{4}', d)]
+def find_commbank_dir():
+    """Return the newest DD-MM-YYYY export folder under commbank_csv"""
+    commbank_root = os.path.join(project_root, 'commbank_csv')
+    
+    commbank_dirs = [d for d in os.listdir(commbank_root) if os.path.isdir(os.path.join(commbank_root, d)) and re.match(r'\d{2}-\d{2}-\d{4}', d)]
+    
+    if not commbank_dirs:
+        raise ValueError(f"No date folders found in {commbank_root}. Please ensure the directory contains folders with format DD-MM-YYYY.")
+    
+    latest_dir = max(commbank_dirs, key=lambda x: datetime.strptime(x, '%d-%m-%Y'))
+    commbank_dir = os.path.join(commbank_root, latest_dir)
+    
+    print(f"Using CommBank data from: {commbank_dir}")
+    return commbank_dir
+
+# (file name, account, statement kind) for each CommBank export, in load order
+STATEMENT_FILES = [
+    ('CBA_CC.csv', 'credit_card', 'credit_card'),
+    ('CBA_DEBIT.csv', 'debit', 'bank_account'),
+    ('CBA_EMERGENCY_FUND.csv', 'emergency_fund', 'bank_account'),
+    ('CBA_OLD_CC.csv', 'old_credit_card', 'credit_card'),
+    ('CBA_SAVER.csv', 'saver', 'bank_account'),
+]
 
-if not commbank_dirs:
-    raise ValueError(f"No date folders found in {commbank_dir}. Please ensure the directory contains folders with format DD-MM-YYYY.")
+TRANSFER_KEYWORDS = ['TRANSFER TO', 'TRANSFER FROM', 'BPAY', 'NETBANK', 'COMMBANK APP']
+TRANSFER_PATTERN = re.compile('|'.join(re.escape(keyword) for keyword in TRANSFER_KEYWORDS))
 
-today = datetime.now()
-commbank_dirs = sorted(commbank_dirs, 
-                      key=lambda x: abs((datetime.strptime(x, '%d-%m-%Y') - today).days))
+ACCOUNT_REFERENCE_PATTERN = re.compile(r'xx\d+')
 
-latest_dir = max(commbank_dirs, key=lambda x: datetime.strptime(x, '%d-%m-%Y'))
-commbank_dir = os.path.join(commbank_dir, latest_dir)
+# Account number suffixes that appear in transfer descriptions, by account
+ACCOUNT_REFERENCES = {
+    'xx5784': 'credit_card',
+    'xx9070': 'debit',
+    'xx1893': 'emergency_fund',
+    'xx1212': 'old_credit_card',
+    'xx2467': 'saver',
+}
 
-print(f"Using CommBank data from: {commbank_dir}")
+@dataclass(slots=True)
+class RawTransaction:
+    """A single statement row, classified but not yet in double-entry form"""
+    source_file: str
+    date: Any
+    date_iso: str
+    amount: float
+    description: str
+    account: str
+    account_code: int
+    category: str
+    is_transfer: bool
+    account_reference: Optional[str]
+    balance: Optional[float] = None
+    processed: bool = False
 
 class EnhancedDoubleEntryAccountingSystem:
     def __init__(self):
@@ -38,11 +81,21 @@ class EnhancedDoubleEntryAccountingSystem:
             'transfer': {'name': 'Internal Transfers', 'type': 'EQUITY', 'id': None, 'api_type': None},
         }
         
+        # Integer codes for self.accounts, with per-code lookups for the hot paths
+        self._account_codes = {account: code for code, account in enumerate(self.accounts)}
+        self._account_types = [info['type'] for info in self.accounts.values()]
+        self._account_names = [info['name'] for info in self.accounts.values()]
+        # Debits increase ASSET and EXPENSE balances and decrease the rest; credits do the opposite
+        self._debit_signs = np.array([1.0 if account_type in ('ASSET', 'EXPENSE') else -1.0
+                                      for account_type in self._account_types])
+        
         self.raw_transactions = []
         self.processed_transactions = []
         self.unified_transactions = []
         
         self.account_balances = {account: 0 for account in self.accounts}
+        # Balances of every account after each unified transaction, in self.accounts order
+        self._balance_snapshots = np.empty((0, len(self.accounts)))
         
         self.categories = {
             'groceries': [
@@ -85,161 +138,158 @@ class EnhancedDoubleEntryAccountingSystem:
         }
         
         self.pending_transfers = []
-    
-    def parse_date(self, date_str):
-        """Parse date string to datetime object"""
-        try:
-            return datetime.strptime(date_str, "%d/%m/%Y")
-        except ValueError:
-
-            return date_str
-    
-    def parse_amount(self, amount_str):
-        """Parse amount string to float"""
-        if isinstance(amount_str, str):
-
-            amount_str = amount_str.replace(',', '')
-            if amount_str.startswith('(') and amount_str.endswith(')'):
-                amount_str = '-' + amount_str[1:-1]
-            
-            amount_str = amount_str.strip('"')
-            
-            try:
-                return float(amount_str)
-            except ValueError:
-                return 0
-        return amount_str
-    
-    def clean_description(self, description):
-        """Clean and standardize description"""
-        if isinstance(description, str):
-            description = description.strip('"')
-            description = ' '.join(description.split())
-            return description
-        return ""
-    
-    def categorize_transaction(self, description):
-        """Categorize a transaction based on its description"""
-        description_upper = description.upper()
-        
-        for category, keywords in self.categories.items():
-            for keyword in keywords:
-                if keyword.upper() in description_upper:
-                    return category
+        self._transfer_candidates = None
         
-        return 'uncategorized'
-    
-    def is_transfer(self, description):
-        """Check if a transaction is likely a transfer between accounts"""
-        description_upper = description.upper()
-        
-        transfer_keywords = [
-            'TRANSFER TO', 'TRANSFER FROM', 'BPAY', 'NETBANK', 'COMMBANK APP'
+        # Keywords are matched against uppercased descriptions
+        self._category_patterns = [
+            (category, re.compile('|'.join(re.escape(keyword.upper()) for keyword in keywords)))
+            for category, keywords in self.categories.items() if keywords
         ]
-        
-        for keyword in transfer_keywords:
-            if keyword.upper() in description_upper:
-                return True
-        
-        return False
     
-    def extract_account_reference(self, description):
-        """Extract account reference from description"""
-        account_match = re.search(r'xx(\d+)', description)
-        if account_match:
-            return account_match.group(0)
-        return None
+    def read_statement(self, filepath):
+        """Read a CommBank CSV export, keeping only rows with a non-zero amount"""
+        statement = read_statement_csv(filepath)
+        # Amounts are parsed first so zero-amount rows, and short rows with no
+        # description, are dropped before any other column is touched
+        amounts = parse_amounts(statement['amount'])
+        keep = (amounts != 0) & statement['description'].ne('')
+        statement = statement[keep].assign(amount=amounts[keep])
+        balances = statement['balance']
+        dates, iso_dates = parse_dates(statement['date'], with_iso=True)
+        return statement.assign(
+            date=dates,
+            date_iso=iso_dates,
+            balance=parse_amounts(balances).astype(object).where(balances != '', None),
+        )
+    
+    def classify_statement(self, statement):
+        """
+        Add cleaned description, category, transfer and account reference columns.
+        
+        Descriptions have quotes stripped and whitespace collapsed. Each distinct
+        description is classified once, since recurring merchants repeat heavily.
+        """
+        descriptions = statement['description'].str.strip('"').str.split().str.join(' ')
+        unique_descriptions = pd.Index(descriptions.unique())
+        classified = self.classify_descriptions(pd.Series(unique_descriptions, dtype=object))
+        rows = unique_descriptions.get_indexer(descriptions)
+        
+        return statement.assign(
+            description=descriptions,
+            **{column: pd.Series(values.to_numpy().take(rows), index=statement.index, dtype=values.dtype)
+               for column, values in classified.items()},
+        )
+    
+    def classify_descriptions(self, descriptions):
+        """Return category, is_transfer and account_reference columns for cleaned descriptions"""
+        # Uppercase once and match uppercased keywords, rather than case-folding per pattern
+        descriptions_upper = descriptions.str.upper()
+        
+        categories = pd.Series('uncategorized', index=descriptions.index, dtype=object)
+        remaining = descriptions_upper
+        for category, pattern in self._category_patterns:
+            if remaining.empty:
+                break
+            matched = remaining.str.contains(pattern)
+            categories[matched[matched].index] = category
+            remaining = remaining[~matched]
+        
+        account_references = descriptions.str.extract('(' + ACCOUNT_REFERENCE_PATTERN.pattern + ')', expand=False)
+        
+        return {
+            'category': categories,
+            'is_transfer': descriptions_upper.str.contains(TRANSFER_PATTERN),
+            'account_reference': account_references.astype(object).where(account_references.notna(), None),
+        }
     
     def load_credit_card(self, filepath, account_type='credit_card'):
         """Load credit card transactions from CSV file"""
         try:
-            with open(filepath, 'r') as file:
-                reader = csv.reader(file)
-                rows = list(reader)
+            statement = self.classify_statement(self.read_statement(filepath))
+            account_code = self._account_codes[account_type]
             
-            for row in rows:
-                if len(row) >= 3:
-                    date = self.parse_date(row[0])
-                    amount = self.parse_amount(row[1])
-                    description = self.clean_description(row[2])
-                    
-                    if amount != 0:
-                        transaction = {
-                            'source_file': filepath,
-                            'date': date,
-                            'amount': amount,
-                            'description': description,
-                            'account': account_type,
-                            'category': self.categorize_transaction(description),
-                            'is_transfer': self.is_transfer(description),
-                            'account_reference': self.extract_account_reference(description)
-                        }
-                        
-                        self.raw_transactions.append(transaction)
+            for row in statement.itertuples(index=False):
+                transaction = RawTransaction(
+                    source_file=filepath,
+                    date=row.date,
+                    date_iso=row.date_iso,
+                    amount=row.amount,
+                    description=row.description,
+                    account=account_type,
+                    account_code=account_code,
+                    category=row.category,
+                    is_transfer=row.is_transfer,
+                    account_reference=row.account_reference
+                )
+                
+                self.raw_transactions.append(transaction)
         except Exception as e:
             print(f"Error loading {filepath}: {str(e)}")
     
     def load_bank_account(self, filepath, account_type):
         """Load bank account transactions from CSV file"""
         try:
-            with open(filepath, 'r') as file:
-                reader = csv.reader(file)
-                rows = list(reader)
+            statement = self.classify_statement(self.read_statement(filepath))
+            account_code = self._account_codes[account_type]
             
-            for row in rows:
-                if len(row) >= 3:  
-                    date = self.parse_date(row[0])
-                    amount = self.parse_amount(row[1])
-                    description = self.clean_description(row[2])
-                    balance = self.parse_amount(row[3]) if len(row) > 3 and row[3] else None
-                    
-                    if amount != 0:
-                        transaction = {
-                            'source_file': filepath,
-                            'date': date,
-                            'amount': amount,
-                            'description': description,
-                            'balance': balance,
-                            'account': account_type,
-                            'category': self.categorize_transaction(description),
-                            'is_transfer': self.is_transfer(description),
-                            'account_reference': self.extract_account_reference(description)
-                        }
-                        
-                        self.raw_transactions.append(transaction)
+            for row in statement.itertuples(index=False):
+                transaction = RawTransaction(
+                    source_file=filepath,
+                    date=row.date,
+                    date_iso=row.date_iso,
+                    amount=row.amount,
+                    description=row.description,
+                    balance=row.balance,
+                    account=account_type,
+                    account_code=account_code,
+                    category=row.category,
+                    is_transfer=row.is_transfer,
+                    account_reference=row.account_reference
+                )
+                
+                self.raw_transactions.append(transaction)
         except Exception as e:
             print(f"Error loading {filepath}: {str(e)}")
     
     def process_raw_transactions(self):
         """Process raw transactions into double-entry format"""
+        # Undated transactions sort last; take the clock once rather than per key
+        now = datetime.now()
         sorted_transactions = sorted(self.raw_transactions, 
-                                   key=lambda x: x['date'] if isinstance(x['date'], datetime) else datetime.now())
+                                   key=lambda x: x.date if isinstance(x.date, datetime) else now)
         
-        for transaction in sorted_transactions:
-            if 'processed' in transaction and transaction['processed']:
+        self._index_transfer_candidates()
+        transaction_ids = [str(transaction_id) for transaction_id in uuid4_batch(len(sorted_transactions))]
+        
+        for transaction, transaction_id in zip(sorted_transactions, transaction_ids):
+            if transaction.processed:
                 continue
             
-            processed_transaction = self._create_processed_transaction(transaction)
+            processed_transaction = self._create_processed_transaction(transaction, transaction_id)
             
-            transaction['processed'] = True
+            transaction.processed = True
             
             self.processed_transactions.append(processed_transaction)
+        
+        # Later loads add raw transactions, so don't keep a stale index around
+        self._transfer_candidates = None
     
-    def _create_processed_transaction(self, transaction):
+    def _create_processed_transaction(self, transaction, transaction_id=None):
         """Create a processed transaction with appropriate double entries"""
         processed_transaction = {
-            'id': str(uuid.uuid4()),
-            'date': transaction['date'],
-            'description': transaction['description'],
-            'category': transaction['category'],
+            'id': transaction_id or str(uuid.uuid4()),
+            'date': transaction.date,
+            'date_iso': transaction.date_iso,
+            'description': transaction.description,
+            'category': transaction.category,
             'entries': []
         }
         
-        account = transaction['account']
-        amount = transaction['amount']
-        is_transfer = transaction['is_transfer']
-        account_reference = transaction['account_reference']
-        account_type = self.accounts[account]['type']
+        account = transaction.account
+        amount = transaction.amount
+        is_transfer = transaction.is_transfer
+        account_reference = transaction.account_reference
+        account_type = self._account_types[transaction.account_code]
         
         if account_type == 'LIABILITY':
             self._process_liability_transaction(processed_transaction, transaction)
@@ -250,9 +300,9 @@ class EnhancedDoubleEntryAccountingSystem:
     
     def _process_liability_transaction(self, processed_transaction, transaction):
         """Process a liability (credit card) transaction"""
-        account = transaction['account']
-        amount = transaction['amount']
-        is_transfer = transaction['is_transfer']
+        account = transaction.account
+        amount = transaction.amount
+        is_transfer = transaction.is_transfer
         
         if amount < 0:  # Expense on credit card
             self._add_entry(processed_transaction, 'expense', abs(amount), 'DEBIT')
@@ -269,10 +319,10 @@ class EnhancedDoubleEntryAccountingSystem:
     
     def _process_asset_transaction(self, processed_transaction, transaction):
         """Process an asset (debit/savings) transaction"""
-        account = transaction['account']
-        amount = transaction['amount']
-        is_transfer = transaction['is_transfer']
-        account_reference = transaction['account_reference']
+        account = transaction.account
+        amount = transaction.amount
+        is_transfer = transaction.is_transfer
+        account_reference = transaction.account_reference
         
         if amount < 0:  # Money going out
             # Handle the debit side of the transaction
@@ -296,8 +346,8 @@ class EnhancedDoubleEntryAccountingSystem:
     
     def _handle_transfer_debit(self, processed_transaction, transaction):
         """Handle the debit side of a transfer transaction"""
-        amount = transaction['amount']
-        account_reference = transaction['account_reference']
+        amount = transaction.amount
+        account_reference = transaction.account_reference
         
         if account_reference:
             # Try to identify destination account
@@ -311,16 +361,16 @@ class EnhancedDoubleEntryAccountingSystem:
     
     def _handle_transfer_credit(self, processed_transaction, transaction):
         """Handle the credit side of a transfer transaction"""
-        account = transaction['account']
-        amount = transaction['amount']
-        account_reference = transaction['account_reference']
+        account = transaction.account
+        amount = transaction.amount
+        account_reference = transaction.account_reference
         
         # For liability accounts, try to find matching transfer
-        if self.accounts[account]['type'] == 'LIABILITY':
+        if self._account_types[transaction.account_code] == 'LIABILITY':
             matching_transfer = self.find_matching_transfer(transaction, amount)
             if matching_transfer:
-                self._add_entry(processed_transaction, matching_transfer['account'], amount, 'CREDIT')
-                matching_transfer['processed'] = True
+                self._add_entry(processed_transaction, matching_transfer.account, amount, 'CREDIT')
+                matching_transfer.processed = True
                 return
         
         # For asset accounts with reference, try to identify source account
@@ -344,137 +394,139 @@ class EnhancedDoubleEntryAccountingSystem:
     def find_matching_transfer(self, transaction, amount):
         """Find a matching transfer transaction from another account"""
         # Transfers are usually within 1-2 days of each other
-        if not isinstance(transaction['date'], datetime):
+        if not isinstance(transaction.date, datetime):
             return None
             
-        date_range_start = transaction['date'] - timedelta(days=2)
-        date_range_end = transaction['date'] + timedelta(days=2)
+        date_range_start = transaction.date - timedelta(days=2)
+        date_range_end = transaction.date + timedelta(days=2)
         
-        for other_tx in self.raw_transactions:
-            if 'processed' in other_tx and other_tx['processed']:
+        if self._transfer_candidates is None:
+            self._index_transfer_candidates()
+        
+        for other_tx in self._transfer_candidates.get(abs(amount), ()):
+            if other_tx.processed:
                 continue
                 
-            if (other_tx['account'] != transaction['account'] and 
-                isinstance(other_tx['date'], datetime) and
-                date_range_start <= other_tx['date'] <= date_range_end and
-                abs(other_tx['amount']) == abs(amount) and
-                (other_tx['amount'] < 0) == (transaction['amount'] > 0)):
+            if (other_tx.account != transaction.account and 
+                date_range_start <= other_tx.date <= date_range_end and
+                (other_tx.amount < 0) == (transaction.amount > 0)):
                 
                 return other_tx
         
         return None
+    
+    def _index_transfer_candidates(self):
+        """Bucket dated raw transactions by absolute amount, keeping load order"""
+        self._transfer_candidates = defaultdict(list)
+        for transaction in self.raw_transactions:
+            if isinstance(transaction.date, datetime):
+                self._transfer_candidates[abs(transaction.amount)].append(transaction)
 
     def find_account_by_reference(self, account_reference):
-            """Find the account matching a reference in a transaction description"""
-            # This would typically require a mapping of account references to account names
-            # For now, we'll use a simple heuristic based on the last digits
-            if account_reference:
-                if account_reference == 'xx5784':
-                    return 'credit_card'
-                elif account_reference == 'xx9070':
-                    return 'debit'
-                elif account_reference == 'xx1893':
-                    return 'emergency_fund'
-                elif account_reference == 'xx1212':
-                    return 'old_credit_card'
-                elif account_reference == 'xx2467':
-                    return 'saver'
-            
-            return None
+        """Find the account matching a reference in a transaction description"""
+        return ACCOUNT_REFERENCES.get(account_reference)
     
     def update_account_balances(self):
         """Update all account balances based on processed transactions"""
-        # Reset balances
-        self.account_balances = {account: 0 for account in self.accounts}
+        account_keys = list(self.accounts)
+        account_codes = self._account_codes
+        account_names = self._account_names
+        
+        # process_raw_transactions already appends in date order
+        sorted_transactions = self.processed_transactions
         
-        # Sort transactions by date
-        sorted_transactions = sorted(self.processed_transactions, 
-                                   key=lambda x: x['date'] if isinstance(x['date'], datetime) else datetime.now())
+        # Flatten entries on known accounts into (transaction, account, amount) columns
+        entry_positions = []
+        entry_accounts = []
+        entry_amounts = []
+        unified_transactions = []
         
-        # Process each transaction
-        for transaction in sorted_transactions:
+        for position, transaction in enumerate(sorted_transactions):
             # Create a unified transaction record
             unified_transaction = {
                 'id': transaction['id'],
-                'date': transaction['date'].strftime('%Y-%m-%d') if isinstance(transaction['date'], datetime) else str(transaction['date']),
+                'date': transaction['date_iso'],
                 'description': transaction['description'],
                 'category': transaction['category'],
-                'entries': [],
-                'balances': {}
+                'entries': []
             }
             
-            # Process each entry in the transaction
             for entry in transaction['entries']:
                 account = entry['account']
                 amount = entry['amount']
                 entry_type = entry['type']
                 
-                # Update account balance based on entry type and account type
-                if account in self.accounts:
-                    account_type = self.accounts[account]['type']
-                    
-                    if entry_type == 'DEBIT':
-                        if account_type in ['ASSET', 'EXPENSE']:
-                            self.account_balances[account] += amount
-                        else:  # LIABILITY, EQUITY, INCOME
-                            self.account_balances[account] -= amount
-                    else:  # CREDIT
-                        if account_type in ['ASSET', 'EXPENSE']:
-                            self.account_balances[account] -= amount
-                        else:  # LIABILITY, EQUITY, INCOME
-                            self.account_balances[account] += amount
+                code = account_codes.get(account)
+                if code is not None:
+                    entry_positions.append(position)
+                    entry_accounts.append(code)
+                    entry_amounts.append(amount if entry_type == 'DEBIT' else -amount)
                 
                 # Add entry to unified transaction
                 unified_transaction['entries'].append({
                     'account': account,
-                    'account_name': self.accounts[account]['name'] if account in self.accounts else "Unknown",
+                    'account_name': account_names[code] if code is not None else "Unknown",
                     'amount': amount,
                     'type': entry_type
                 })
             
-            # Add the current balances to the transaction
-            unified_transaction['balances'] = self.account_balances.copy()
-            
-            # Add the unified transaction to the list
-            self.unified_transactions.append(unified_transaction)
+            unified_transactions.append(unified_transaction)
+        
+        # Running balance of every account after each transaction
+        deltas = np.zeros((len(sorted_transactions), len(account_keys)))
+        entry_accounts = np.array(entry_accounts, dtype=np.intp)
+        np.add.at(deltas, (np.array(entry_positions, dtype=np.intp), entry_accounts),
+                  np.array(entry_amounts, dtype=float) * self._debit_signs[entry_accounts])
+        running_balances = np.cumsum(deltas, axis=0)
+        
+        # One row per unified transaction; dicts are only built on request by balances_at
+        self._balance_snapshots = np.concatenate((self._balance_snapshots, running_balances))
+        
+        if unified_transactions:
+            self.account_balances = dict(zip(account_keys, running_balances[-1].tolist()))
+        else:
+            self.account_balances = {account: 0 for account in self.accounts}
+        
+        self.unified_transactions.extend(unified_transactions)
+    
+    def balances_at(self, position):
+        """Return the account balances after the unified transaction at position"""
+        return dict(zip(self.accounts, self._balance_snapshots[position].tolist()))
     
     def prepare_for_up_bank_api(self):
         """Convert transactions to Up Bank API format"""
-        up_bank_transactions = []
-        
+        return list(self.iter_up_bank_transactions())
+    
+    def iter_up_bank_transactions(self):
+        """Yield transactions in Up Bank API format one at a time"""
         for transaction in self.unified_transactions:
-            # Get the main entry details - prioritize real accounts over transfer/expense/income
-            main_entry = next((entry for entry in transaction['entries'] 
-                             if entry['account'] in ['credit_card', 'debit', 'emergency_fund', 'saver', 'old_credit_card']), None)
-            
-            if not main_entry:
-                main_entry = next((entry for entry in transaction['entries']), None)
-                
-            if not main_entry:
-                continue
-                
-            # Determine transaction amount - positive for income, negative for expense
-            amount = 0
-            source_account = None
-            
-            # Find the affected real account
+            # One pass over the entries: the first real account is the source, the
+            # first other real account is the transfer counterpart
+            main_entry = None
+            transfer_account = None
+            is_transfer = False
             for entry in transaction['entries']:
-                if entry['account'] in ['credit_card', 'debit', 'emergency_fund', 'saver', 'old_credit_card']:
-                    source_account = entry['account']
-                    # For assets, debits increase (+), credits decrease (-)
-                    # For liabilities, debits decrease (+), credits increase (-)
-                    account_type = self.accounts[entry['account']]['type']
-                    
-                    if account_type == 'ASSET':
-                        amount = entry['amount'] if entry['type'] == 'DEBIT' else -entry['amount']
-                    else:  # LIABILITY
-                        amount = -entry['amount'] if entry['type'] == 'DEBIT' else entry['amount']
-                    
-                    break
+                account = entry['account']
+                if account == 'transfer':
+                    is_transfer = True
+                elif account in REAL_ACCOUNTS:
+                    if main_entry is None:
+                        main_entry = entry
+                    elif transfer_account is None and account != main_entry['account']:
+                        transfer_account = account
             
             # If no real account found, skip
-            if not source_account:
+            if main_entry is None:
                 continue
+            
+            # Determine transaction amount - positive for income, negative for expense
+            # For assets, debits increase (+), credits decrease (-)
+            # For liabilities, debits decrease (+), credits increase (-)
+            source_account = main_entry['account']
+            if self.accounts[source_account]['type'] == 'ASSET':
+                amount = main_entry['amount'] if main_entry['type'] == 'DEBIT' else -main_entry['amount']
+            else:  # LIABILITY
+                amount = -main_entry['amount'] if main_entry['type'] == 'DEBIT' else main_entry['amount']
                 
             account_id = self.accounts[source_account]['id']
             account_name = self.accounts[source_account]['name']
@@ -518,39 +570,28 @@ class EnhancedDoubleEntryAccountingSystem:
                 }
             }
             
-            is_transfer = any(entry['account'] == 'transfer' for entry in transaction['entries'])
-            if is_transfer:
-                account_entries = [entry for entry in transaction['entries'] 
-                                  if entry['account'] in ['credit_card', 'debit', 'emergency_fund', 'saver', 'old_credit_card'] 
-                                  and entry['account'] != source_account]
-                
-                if account_entries:
-                    transfer_account = account_entries[0]['account']
-                    up_transaction["relationships"]["transferAccount"] = {
-                        "data": {
-                            "type": "accounts",
-                            "id": self.accounts[transfer_account]['id']
-                        }
+            if is_transfer and transfer_account:
+                up_transaction["relationships"]["transferAccount"] = {
+                    "data": {
+                        "type": "accounts",
+                        "id": self.accounts[transfer_account]['id']
                     }
+                }
             
-            up_bank_transactions.append(up_transaction)
-            
-        return up_bank_transactions
+            yield up_transaction
     
     def export_to_json(self, output_file):
         """Export transactions to JSON in Up Bank API format"""
-        up_bank_data = {
-            "data": self.prepare_for_up_bank_api(),
-            "links": {
-                "prev": None,
-                "next": None
-            }
-        }
-        
         output_path = os.path.join(project_root, 'outputs', output_file)
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, 'w') as f:
-            json.dump(up_bank_data, f, indent=2)
+        # Written one transaction at a time so the full list is never held in memory
+        with open(output_path, 'wb') as f:
+            f.write(b'{"data":[')
+            for index, up_transaction in enumerate(self.iter_up_bank_transactions()):
+                if index:
+                    f.write(b',')
+                f.write(orjson.dumps(up_transaction))
+            f.write(b'],"links":{"prev":null,"next":null}}\n')
             
         print(f"Exported {len(self.unified_transactions)} transactions to {output_file}")
         
@@ -575,6 +616,17 @@ class EnhancedDoubleEntryAccountingSystem:
                         "createdAt": "2023-01-01T00:00:00+10:00"
                     }
                 })
+        
+        output_path = os.path.join(project_root, 'outputs', output_file)
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps({
+                "data": account_data,
+                "links": {
+                    "prev": None,
+                    "next": None
+                }
+            }, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
             
         print(f"Exported {len(account_data)} accounts to {output_file}")
         
@@ -600,14 +652,26 @@ class EnhancedDoubleEntryAccountingSystem:
             if account in self.accounts:
                 print(f"{self.accounts[account]['name']}: ${balance:.2f}")
 
+def parse_file(filepath, account_type, kind):
+    """Load one statement in a fresh accounting system and return its raw transactions"""
+    accounting_system = EnhancedDoubleEntryAccountingSystem()
+    if kind == 'credit_card':
+        accounting_system.load_credit_card(filepath, account_type)
+    else:
+        accounting_system.load_bank_account(filepath, account_type)
+    return accounting_system.raw_transactions
+
 def process_bank_data():
+    commbank_dir = find_commbank_dir()
     accounting_system = EnhancedDoubleEntryAccountingSystem()
     
-    accounting_system.load_credit_card(os.path.join(commbank_dir, 'CBA_CC.csv'), 'credit_card')
-    accounting_system.load_bank_account(os.path.join(commbank_dir, 'CBA_DEBIT.csv'), 'debit')
-    accounting_system.load_bank_account(os.path.join(commbank_dir, 'CBA_EMERGENCY_FUND.csv'), 'emergency_fund')
-    accounting_system.load_credit_card(os.path.join(commbank_dir, 'CBA_OLD_CC.csv'), 'old_credit_card')
-    accounting_system.load_bank_account(os.path.join(commbank_dir, 'CBA_SAVER.csv'), 'saver')
+    # Statements are parsed on threads, since pandas' C parser releases the GIL,
+    # and merged back in STATEMENT_FILES order
+    with ThreadPoolExecutor(max_workers=len(STATEMENT_FILES)) as executor:
+        futures = [executor.submit(parse_file, os.path.join(commbank_dir, filename), account_type, kind)
+                   for filename, account_type, kind in STATEMENT_FILES]
+        for future in futures:
+            accounting_system.raw_transactions.extend(future.result())
     
     accounting_system.process_raw_transactions()
     accounting_system.update_account_balances()
@@ -616,22 +680,17 @@ def process_bank_data():
     accounting_system.verify_double_entry_accounting()
     
     accounting_system.export_to_json('combined_transactions.json')
-    accounting_system.export_accounts_to_json('accounts.json')
+    accounting_system.export_accounts_to_json('commbank_accounts.json')
     
     print(f"\nStatistics:")
     print(f"Total raw transactions: {len(accounting_system.raw_transactions)}")
     print(f"Total processed transactions: {len(accounting_system.processed_transactions)}")
     print(f"Total unified transactions: {len(accounting_system.unified_transactions)}")
     
-    categories = {}
-    for tx in accounting_system.unified_transactions:
-        category = tx.get('category', 'uncategorized')
-        if category not in categories:
-            categories[category] = 0
-        categories[category] += 1
+    categories = Counter(tx.get('category', 'uncategorized') for tx in accounting_system.unified_transactions)
     
     print("\nCategory Breakdown:")
-    for category, count in sorted(categories.items(), key=lambda x: x[1], reverse=True):
+    for category, count in categories.most_common():
         print(f"{category}: {count} transactions")
 
 if __name__ == "__main__":
@@ -1,6 +1,48 @@
-import json
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import orjson
+
+from helpers import REAL_ACCOUNTS, format_cents
+from models import format_transaction_id
+
+# Buffer size for export files, so large payloads reach the OS in a few big writes
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Sign of a real account entry's amount, keyed by (is an asset account, is a debit)
+_AMOUNT_SIGNS = {
+    (True, True): 1,
+    (True, False): -1,
+    (False, True): -1,
+    (False, False): 1,
+}
+
+def dumps_json(data, pretty=False):
+    """
+    Serialize data to JSON bytes with orjson.
+    
+    Args:
+        data: JSON-serializable data
+        pretty (bool, optional): Indent the output by two spaces. Defaults to False.
+        
+    Returns:
+        bytes: The encoded JSON, compact unless pretty is set
+    """
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+
+def to_cents(amount):
+    """
+    Convert a dollar amount to whole cents, rounding rather than truncating.
+    
+    Args:
+        amount (float): Amount in dollars
+        
+    Returns:
+        int: Amount in cents
+    """
+    return int(round(amount * 100))
+
 class Exporter:
     """Exports transactions and accounts to various formats."""
     
@@ -15,6 +57,21 @@ class Exporter:
         self.accounts = accounts or {}
         self.account_balances = account_balances or {}
     
+    @property
+    def accounts(self):
+        """dict: Account keys mapped to their name, type, id and api_type."""
+        return self._accounts
+    
+    @accounts.setter
+    def accounts(self, accounts):
+        # Resolve each account's metadata once per assignment rather than per
+        # transaction or per export
+        self._accounts = accounts
+        self._account_details = {key: (info.get('type'), info.get('id'), info.get('name'), info.get('api_type'))
+                                 for key, info in accounts.items()}
+        # Only accounts with an Up Bank ID are exported
+        self._accounts_with_ids = [(key, info) for key, info in accounts.items() if info.get('id')]
+    
     def prepare_transactions_for_up_bank(self, transactions):
         """
         Prepare transactions for Up Bank API format.
@@ -25,53 +82,56 @@ class Exporter:
         Returns:
             list: Transactions in Up Bank API format
         """
-        up_bank_transactions = []
+        return list(self.iter_transactions_for_up_bank(transactions))
+    
+    def iter_transactions_for_up_bank(self, transactions):
+        """
+        Yield transactions in Up Bank API format one at a time.
         
-        for transaction in transactions:
-            # Get the main entry details - prioritize real accounts over transfer/expense/income
-            main_entry = next((entry for entry in transaction['entries'] 
-                             if entry['account'] in ['credit_card', 'debit', 'emergency_fund', 'saver', 'old_credit_card']), None)
-            
-            if not main_entry:
-                main_entry = next((entry for entry in transaction['entries']), None)
-                
-            if not main_entry:
-                continue
-                
-            # Determine transaction amount - positive for income, negative for expense
-            amount = 0
-            source_account = None
+        Args:
+            transactions (iterable): Transactions to convert
             
-            # Find the affected real account
+        Yields:
+            dict: A transaction in Up Bank API format
+        """
+        account_details = self._account_details
+        
+        for transaction in transactions:
+            # One pass over the entries: the first real account is the source, the
+            # first other real account is the transfer counterpart
+            main_entry = None
+            transfer_account = None
+            is_transfer = False
             for entry in transaction['entries']:
-                if entry['account'] in ['credit_card', 'debit', 'emergency_fund', 'saver', 'old_credit_card']:
-                    source_account = entry['account']
-                    # For assets, debits increase (+), credits decrease (-)
-                    # For liabilities, debits decrease (+), credits increase (-)
-                    account_type = self.accounts[entry['account']]['type']
-                    
-                    if account_type == 'ASSET':
-                        amount = entry['amount'] if entry['type'] == 'DEBIT' else -entry['amount']
-                    else:  # LIABILITY
-                        amount = -entry['amount'] if entry['type'] == 'DEBIT' else entry['amount']
-                    
-                    break
+                account = entry['account']
+                if account == 'transfer':
+                    is_transfer = True
+                elif account in REAL_ACCOUNTS:
+                    if main_entry is None:
+                        main_entry = entry
+                    elif transfer_account is None and account != main_entry['account']:
+                        transfer_account = account
             
             # If no real account found, skip
-            if not source_account:
+            if main_entry is None:
                 continue
-                
-            account_id = self.accounts[source_account]['id']
-            account_name = self.accounts[source_account]['name']
-            account_type = self.accounts[source_account]['api_type']
             
+            # Determine transaction amount - positive for income, negative for expense
+            # For assets, debits increase (+), credits decrease (-)
+            # For liabilities, debits decrease (+), credits increase (-)
+            source_account = main_entry['account']
+            source_type, account_id, account_name, account_type = account_details[source_account]
+            amount = _AMOUNT_SIGNS[source_type == 'ASSET', main_entry['type'] == 'DEBIT'] * main_entry['amount']
+                
             tx_date = transaction['date']
             if isinstance(tx_date, datetime):
                 tx_date = tx_date.strftime('%Y-%m-%d')
+            timestamp = f"{tx_date}T00:00:00+10:00"
+            cents = abs(to_cents(amount))
             
             up_transaction = {
                 "type": "transactions",
-                "id": transaction['id'],
+                "id": format_transaction_id(transaction['id']),
                 "attributes": {
                     "status": "SETTLED",
                     "rawText": transaction['description'],
@@ -80,12 +140,12 @@ class Exporter:
                     "isCategorizable": True,
                     "amount": {
                         "currencyCode": "AUD",
-                        "value": f"{abs(amount):.2f}",
-                        "valueInBaseUnits": int(abs(amount) * 100)
+                        "value": format_cents(cents),
+                        "valueInBaseUnits": cents
                     },
                     "foreignAmount": None,
-                    "settledAt": f"{tx_date}T00:00:00+10:00",
-                    "createdAt": f"{tx_date}T00:00:00+10:00",
+                    "settledAt": timestamp,
+                    "createdAt": timestamp,
                     "category": transaction['category']
                 },
                 "relationships": {
@@ -103,24 +163,15 @@ class Exporter:
                 }
             }
             
-            is_transfer = any(entry['account'] == 'transfer' for entry in transaction['entries'])
-            if is_transfer:
-                account_entries = [entry for entry in transaction['entries'] 
-                                  if entry['account'] in ['credit_card', 'debit', 'emergency_fund', 'saver', 'old_credit_card'] 
-                                  and entry['account'] != source_account]
-                
-                if account_entries:
-                    transfer_account = account_entries[0]['account']
-                    up_transaction["relationships"]["transferAccount"] = {
-                        "data": {
-                            "type": "accounts",
-                            "id": self.accounts[transfer_account]['id']
-                        }
+            if is_transfer and transfer_account:
+                up_transaction["relationships"]["transferAccount"] = {
+                    "data": {
+                        "type": "accounts",
+                        "id": account_details[transfer_account][1]
                     }
+                }
             
-            up_bank_transactions.append(up_transaction)
-            
-        return up_bank_transactions
+            yield up_transaction
     
     def prepare_accounts_for_up_bank(self):
         """
@@ -131,27 +182,27 @@ class Exporter:
         """
         account_data = []
         
-        for account_key, account_info in self.accounts.items():
-            if account_info['id']:  
-                account_data.append({
-                    "type": "accounts",
-                    "id": account_info['id'],
-                    "attributes": {
-                        "displayName": account_info['name'],
-                        "accountType": account_info['api_type'],
-                        "ownershipType": "INDIVIDUAL",
-                        "balance": {
-                            "currencyCode": "AUD",
-                            "value": f"{self.account_balances[account_key]:.2f}",
-                            "valueInBaseUnits": int(self.account_balances[account_key] * 100)
-                        },
-                        "createdAt": "2023-01-01T00:00:00+10:00"
-                    }
-                })
+        for account_key, account_info in self._accounts_with_ids:
+            balance_cents = to_cents(self.account_balances[account_key])
+            account_data.append({
+                "type": "accounts",
+                "id": account_info['id'],
+                "attributes": {
+                    "displayName": account_info['name'],
+                    "accountType": account_info['api_type'],
+                    "ownershipType": "INDIVIDUAL",
+                    "balance": {
+                        "currencyCode": "AUD",
+                        "value": format_cents(balance_cents),
+                        "valueInBaseUnits": balance_cents
+                    },
+                    "createdAt": "2023-01-01T00:00:00+10:00"
+                }
+            })
         
         return account_data
     
-    def export_to_json(self, transactions, transactions_file, accounts_file):
+    def export_to_json(self, transactions, transactions_file, accounts_file, pretty=False):
         """
         Export transactions and accounts to JSON files.
         
@@ -159,34 +210,63 @@ class Exporter:
             transactions (list): List of transactions
             transactions_file (str): Path to transactions JSON file
             accounts_file (str): Path to accounts JSON file
+            pretty (bool, optional): Indent the JSON output. Defaults to False.
         """
-        # Export transactions
-        up_bank_data = {
-            "data": self.prepare_transactions_for_up_bank(transactions),
-            "links": {
-                "prev": None,
-                "next": None
-            }
-        }
-        
-        with open(transactions_file, 'w') as f:
-            json.dump(up_bank_data, f, indent=2)
+        # The accounts file is prepared and written on a worker thread while the
+        # transactions are written here, so the two files' I/O overlaps
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            accounts_written = executor.submit(self._write_accounts_file, accounts_file, pretty)
+            
+            # Export transactions
+            with open(transactions_file, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                if pretty:
+                    f.write(dumps_json({
+                        "data": self.prepare_transactions_for_up_bank(transactions),
+                        "links": {
+                            "prev": None,
+                            "next": None
+                        }
+                    }, pretty))
+                else:
+                    # Compact output is streamed a record at a time, so the converted
+                    # transactions are never all held in memory
+                    f.write(b'{"data":[')
+                    for index, up_transaction in enumerate(self.iter_transactions_for_up_bank(transactions)):
+                        if index:
+                            f.write(b',')
+                        f.write(dumps_json(up_transaction))
+                    f.write(b'],"links":{"prev":null,"next":null}}')
+                
+            print(f"Exported {len(transactions)} transactions to {transactions_file}")
             
-        print(f"Exported {len(transactions)} transactions to {transactions_file}")
+            account_count = accounts_written.result()
+        
+        print(f"Exported {account_count} accounts to {accounts_file}")
+    
+    def _write_accounts_file(self, accounts_file, pretty=False):
+        """
+        Write the accounts in Up Bank API format to a JSON file.
         
-        # Export accounts
+        Args:
+            accounts_file (str): Path to accounts JSON file
+            pretty (bool, optional): Indent the JSON output. Defaults to False.
+            
+        Returns:
+            int: Number of accounts written
+        """
+        accounts = self.prepare_accounts_for_up_bank()
         account_data = {
-            "data": self.prepare_accounts_for_up_bank(),
+            "data": accounts,
             "links": {
                 "prev": None,
                 "next": None
             }
         }
         
-        with open(accounts_file, 'w') as f:
-            json.dump(account_data, f, indent=2)
-            
-        print(f"Exported {len(self.prepare_accounts_for_up_bank())} accounts to {accounts_file}")
+        with open(accounts_file, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(dumps_json(account_data, pretty))
+        
+        return len(accounts)
     
     def export_account_balances(self):
         """Export account balances to console."""
@@ -206,13 +286,8 @@ class Exporter:
         print(f"Total transactions: {len(transactions)}")
         
         # Category breakdown
-        categories = {}
-        for tx in transactions:
-            category = tx.get('category', 'uncategorized')
-            if category not in categories:
-                categories[category] = 0
-            categories[category] += 1
+        categories = Counter(tx.get('category', 'uncategorized') for tx in transactions)
         
         print("\nCategory Breakdown:")
-        for category, count in sorted(categories.items(), key=lambda x: x[1], reverse=True):
+        for category, count in categories.most_common():
             print(f"{category}: {count} transactions") 
\ No newline at end of file
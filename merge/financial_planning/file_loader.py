@@ -1,7 +1,24 @@
 import os
-import csv
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import chain
+
+import pandas as pd
+
+from helpers import parse_amounts, parse_dates, read_statement_csv
+
+# CommBank export folders are named after their download date, DD-MM-YYYY
+DATE_DIR_PATTERN = re.compile(r'\d{2}-\d{2}-\d{4}')
+
+# CommBank export file and account for each statement, in load order
+STATEMENT_FILES = [
+    ('CBA_CC.csv', 'credit_card'),
+    ('CBA_DEBIT.csv', 'debit'),
+    ('CBA_EMERGENCY_FUND.csv', 'emergency_fund'),
+    ('CBA_OLD_CC.csv', 'old_credit_card'),
+    ('CBA_SAVER.csv', 'saver'),
+]
 
 class FileLoader:
     """Loads transaction data from CSV files."""
@@ -25,67 +42,67 @@ class FileLoader:
         Returns:
             str: Latest directory name
         """
-        commbank_dirs = [d for d in os.listdir(commbank_dir) 
-                        if os.path.isdir(os.path.join(commbank_dir, d)) 
-                        and re.match(r'\d{2}-\d{2}-\d{4}', d)]
+        # scandir reports whether each entry is a directory without a stat per entry
+        with os.scandir(commbank_dir) as entries:
+            commbank_dirs = [entry.name for entry in entries
+                             if entry.is_dir() and DATE_DIR_PATTERN.fullmatch(entry.name)]
         
         if not commbank_dirs:
             raise ValueError(f"No date folders found in {commbank_dir}. Please ensure the directory contains folders with format DD-MM-YYYY.")
         
-        today = datetime.now()
-        commbank_dirs = sorted(commbank_dirs, 
-                             key=lambda x: abs((datetime.strptime(x, '%d-%m-%Y') - today).days))
-        
         latest_dir = max(commbank_dirs, key=lambda x: datetime.strptime(x, '%d-%m-%Y'))
         
         print(f"Using CommBank data from: {os.path.join(commbank_dir, latest_dir)}")
         
         return latest_dir
     
-    def load_credit_card(self, file_path, account_id):
-        try:
-            with open(file_path, 'r') as f:
-                reader = csv.reader(f)
-                header = next(reader)  # Skip header row
-                transactions = []
-                for row in reader:
-                    date = self.transaction_processor.parse_date(row[0])
-                    amount = self.transaction_processor.parse_amount(row[1])
-                    description = row[2]
-                    if amount != 0:
-                        transactions.append({
-                            'date': date,
-                            'amount': amount,
-                            'description': description,
-                            'account_id': account_id
-                        })
-                return transactions
-        except Exception as e:
-            print(f"Error loading {file_path}: {str(e)}")
-            return []
+    def read_statement_frame(self, file_path, account_id):
+        """
+        Read a CommBank CSV export into a DataFrame.
+        
+        Dates and amounts are parsed column-wise with pandas rather than per row.
+        
+        Args:
+            file_path (str): Path to the CSV file
+            account_id (str): Account the transactions belong to
+            
+        Returns:
+            pandas.DataFrame: date, amount, description and account_id columns for
+                transactions with a non-zero amount
+        """
+        statement = read_statement_csv(file_path, skiprows=1)
+        amounts = parse_amounts(statement['amount'])
+        keep = amounts != 0
+        statement = pd.DataFrame({
+            'date': parse_dates(statement['date'][keep]),
+            'amount': amounts[keep],
+            'description': statement['description'][keep],
+            'account_id': account_id,
+        })
+        return statement
     
-    def load_bank_account(self, file_path, account_id):
+    def load_statement(self, file_path, account_id):
+        """
+        Load transactions from a CommBank CSV export.
+        
+        Args:
+            file_path (str): Path to the CSV file
+            account_id (str): Account the transactions belong to
+            
+        Returns:
+            list: Transactions with a non-zero amount, or an empty list if the
+                file can't be read
+        """
         try:
-            with open(file_path, 'r') as f:
-                reader = csv.reader(f)
-                header = next(reader)  # Skip header row
-                transactions = []
-                for row in reader:
-                    date = self.transaction_processor.parse_date(row[0])
-                    amount = self.transaction_processor.parse_amount(row[1])
-                    description = row[2]
-                    if amount != 0:
-                        transactions.append({
-                            'date': date,
-                            'amount': amount,
-                            'description': description,
-                            'account_id': account_id
-                        })
-                return transactions
+            return self.read_statement_frame(file_path, account_id).to_dict('records')
         except Exception as e:
             print(f"Error loading {file_path}: {str(e)}")
             return []
     
+    # Credit card and bank account exports share the same layout
+    load_credit_card = load_statement
+    load_bank_account = load_statement
+    
     def load_all_accounts(self, commbank_dir):
         """
         Load all account transactions from CommBank data directory.
@@ -96,36 +113,37 @@ class FileLoader:
         Returns:
             list: List of all transactions
         """
-        all_transactions = []
-        
-        # Load credit card transactions
-        credit_card_transactions = self.load_credit_card(
-            os.path.join(commbank_dir, 'CBA_CC.csv'), 'credit_card'
-        )
-        all_transactions.extend(credit_card_transactions)
-        
-        # Load debit account transactions
-        debit_transactions = self.load_bank_account(
-            os.path.join(commbank_dir, 'CBA_DEBIT.csv'), 'debit'
-        )
-        all_transactions.extend(debit_transactions)
-        
-        # Load emergency fund transactions
-        emergency_fund_transactions = self.load_bank_account(
-            os.path.join(commbank_dir, 'CBA_EMERGENCY_FUND.csv'), 'emergency_fund'
-        )
-        all_transactions.extend(emergency_fund_transactions)
+        # The files are independent and pandas parses with the GIL released, so
+        # read them concurrently; map keeps the results in STATEMENT_FILES order
+        with ThreadPoolExecutor(max_workers=len(STATEMENT_FILES)) as executor:
+            statements = executor.map(
+                self.load_statement,
+                [os.path.join(commbank_dir, file_name) for file_name, _ in STATEMENT_FILES],
+                [account_id for _, account_id in STATEMENT_FILES],
+            )
+            return list(chain.from_iterable(statements))
+    
+    def load_all_accounts_frame(self, commbank_dir):
+        """
+        Load all account transactions from CommBank data directory as one DataFrame.
         
-        # Load old credit card transactions
-        old_credit_card_transactions = self.load_credit_card(
-            os.path.join(commbank_dir, 'CBA_OLD_CC.csv'), 'old_credit_card'
-        )
-        all_transactions.extend(old_credit_card_transactions)
+        Columnar equivalent of load_all_accounts, for callers that filter or
+        aggregate with pandas.
         
-        # Load saver account transactions
-        saver_transactions = self.load_bank_account(
-            os.path.join(commbank_dir, 'CBA_SAVER.csv'), 'saver'
-        )
-        all_transactions.extend(saver_transactions)
+        Args:
+            commbank_dir (str): Path to CommBank data directory
+            
+        Returns:
+            pandas.DataFrame: date, amount, description and account_id columns
+        """
+        frames = []
+        for file_name, account_id in STATEMENT_FILES:
+            file_path = os.path.join(commbank_dir, file_name)
+            try:
+                frames.append(self.read_statement_frame(file_path, account_id))
+            except Exception as e:
+                print(f"Error loading {file_path}: {str(e)}")
         
-        return all_transactions 
\ No newline at end of file
+        if not frames:
+            return pd.DataFrame(columns=['date', 'amount', 'description', 'account_id'])
+        return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,117 @@
+import os
+import uuid
+
+import numpy as np
+import pandas as pd
+from pandas.errors import ParserError
+
+# Accounts backed by a real bank account, as opposed to the expense/income/transfer ledgers
+REAL_ACCOUNTS = frozenset({'credit_card', 'debit', 'emergency_fund', 'saver', 'old_credit_card'})
+
+STATEMENT_COLUMNS = ['date', 'amount', 'description', 'balance']
+
+def uuid4_batch(count):
+    """
+    Generate random (version 4) UUIDs from a single os.urandom read.
+
+    Args:
+        count (int): Number of UUIDs to generate
+
+    Returns:
+        list: uuid.UUID objects
+    """
+    random_bytes = os.urandom(16 * count)
+    return [uuid.UUID(bytes=random_bytes[offset:offset + 16], version=4)
+            for offset in range(0, 16 * count, 16)]
+
+def format_cents(cents):
+    """
+    Format whole cents as a dollar string with two decimal places.
+
+    Args:
+        cents (int): Amount in cents
+
+    Returns:
+        str: The amount in dollars, e.g. "-12.05"
+    """
+    sign = '-' if cents < 0 else ''
+    dollars, cents = divmod(abs(cents), 100)
+    return f"{sign}{dollars}.{cents:02d}"
+
+def parse_amounts(amounts):
+    """
+    Parse a column of CommBank amount strings.
+
+    Thousands separators and surrounding quotes are stripped and "(12.50)" is
+    read as -12.50.
+
+    Args:
+        amounts (pandas.Series): Amount strings
+
+    Returns:
+        pandas.Series: Parsed amounts, 0 where unparseable
+    """
+    amounts = amounts.str.replace(',', '', regex=False)
+    negative = amounts.str.startswith('(') & amounts.str.endswith(')')
+    amounts = amounts.where(~negative, '-' + amounts.str[1:-1]).str.strip('"')
+    values = pd.to_numeric(amounts, errors='coerce')
+
+    # float() accepts a few spellings to_numeric doesn't, so only the cells
+    # it rejected go through the scalar path
+    rejected = values.isna() & amounts.notna()
+    if rejected.any():
+        values = values.astype(float)
+        values[rejected] = amounts[rejected].map(_parse_amount_scalar)
+    return values.fillna(0)
+
+def _parse_amount_scalar(amount):
+    """Parse one cleaned amount string like float(), 0 where unparseable"""
+    try:
+        return float(amount)
+    except ValueError:
+        return 0
+
+def parse_dates(dates, with_iso=False):
+    """
+    Parse a column of DD/MM/YYYY date strings.
+
+    Args:
+        dates (pandas.Series): Date strings
+        with_iso (bool, optional): Also return the dates as YYYY-MM-DD strings,
+            so exports don't need a strftime per transaction. Defaults to False.
+
+    Returns:
+        pandas.Series: datetime objects, or the original string where parsing
+            fails; with with_iso, a tuple of that and the YYYY-MM-DD strings
+    """
+    parsed = pd.to_datetime(dates, format="%d/%m/%Y", errors='coerce', cache=True)
+    valid = parsed.notna()
+    # Plain datetimes rather than Timestamps
+    datetimes = np.asarray(parsed.dt.to_pydatetime(), dtype=object)
+    datetimes = pd.Series(datetimes, index=dates.index, dtype=object).where(valid, dates)
+    if not with_iso:
+        return datetimes
+    return datetimes, parsed.dt.strftime('%Y-%m-%d').astype(object).where(valid, dates)
+
+def read_statement_csv(filepath, skiprows=0):
+    """
+    Read a CommBank CSV export as strings, one column per STATEMENT_COLUMNS.
+    
+    Fields past the balance are ignored, so a row with extra fields is read
+    like any other; missing trailing fields are empty strings.
+    
+    Args:
+        filepath (str): Path to the CSV file
+        skiprows (int, optional): Leading lines to skip. Defaults to 0.
+    
+    Returns:
+        pandas.DataFrame: The date, amount, description and balance columns
+    """
+    options = dict(header=None, skiprows=skiprows, names=STATEMENT_COLUMNS, dtype=str,
+                   keep_default_na=False, index_col=False)
+    try:
+        return pd.read_csv(filepath, usecols=range(len(STATEMENT_COLUMNS)), **options)
+    except ParserError:
+        # usecols needs a row that reaches the balance field; credit card
+        # exports have none, so they have no extra fields to drop either
+        return pd.read_csv(filepath, **options)
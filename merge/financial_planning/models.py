@@ -1,9 +1,29 @@
 from datetime import datetime
 import uuid
 
+def format_transaction_id(transaction_id):
+    """
+    Format a transaction ID for output.
+    
+    Processed transactions carry their UUID as a 128-bit int; it only becomes
+    the usual string form where it leaves the pipeline.
+    
+    Args:
+        transaction_id (int or str): Integer UUID, or an ID already in string form
+        
+    Returns:
+        str: The UUID string, or the ID unchanged if it isn't an int
+    """
+    if isinstance(transaction_id, int):
+        return str(uuid.UUID(int=transaction_id))
+    return transaction_id
+
 class Transaction:
     """Represents a financial transaction from a bank statement."""
     
+    __slots__ = ('source_file', 'date', 'amount', 'description', 'account', 'category',
+                 'is_transfer', 'account_reference', 'balance')
+    
     def __init__(self, source_file, date, amount, description, account, category=None, 
                  is_transfer=False, account_reference=None, balance=None):
         """
@@ -63,6 +83,8 @@ class Transaction:
 class Account:
     """Represents a financial account."""
     
+    __slots__ = ('name', 'account_type', 'account_id', 'api_type')
+    
     def __init__(self, name, account_type, account_id=None, api_type=None):
         """
         Initialize an account.
@@ -101,6 +123,8 @@ class Account:
 class Category:
     """Represents a transaction category with keywords for matching."""
     
+    __slots__ = ('name', 'keywords', '_keywords_upper')
+    
     def __init__(self, name, keywords):
         """
         Initialize a category.
@@ -111,6 +135,8 @@ class Category:
         """
         self.name = name
         self.keywords = keywords
+        # Uppercased once here rather than on every match
+        self._keywords_upper = tuple(keyword.upper() for keyword in keywords)
         
     def matches(self, description):
         """
@@ -123,7 +149,7 @@ class Category:
             bool: True if the description matches, False otherwise
         """
         description_upper = description.upper()
-        return any(keyword.upper() in description_upper for keyword in self.keywords)
+        return any(keyword in description_upper for keyword in self._keywords_upper)
     
     def to_dict(self):
         """Convert the category to a dictionary."""
@@ -1,12 +1,62 @@
+import logging
 import uuid
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
 from datetime import datetime, timedelta
+from operator import itemgetter
 import re
 
-from models import Transaction, Account, Category
+import numpy as np
+
+from helpers import REAL_ACCOUNTS, uuid4_batch
+from models import Transaction, Account, Category, format_transaction_id
+
+logger = logging.getLogger(__name__)
+
+# Account numbers quoted in descriptions, like xx1234
+_ACCOUNT_REF_RE = re.compile(r'xx\d+')
+
+# Description keywords that mark a transfer between accounts
+_TRANSFER_RE = re.compile(r'TRANSFER TO|TRANSFER FROM|BPAY|NETBANK|COMMBANK APP', re.IGNORECASE)
+
+def _compile_category_pattern(categories):
+    """
+    Combine every category's keywords into one regex with a group per category.
+    
+    The lookahead reports a match at each position and, at any one position,
+    the earliest category wins, so the lowest group index over the whole
+    description is the category a keyword-by-keyword scan would return.
+    
+    Args:
+        categories (dict): Category names mapped to keyword lists
+        
+    Returns:
+        tuple: Category names in group order, and the compiled pattern (None if
+            no category has keywords)
+    """
+    names = []
+    groups = []
+    for category, keywords in categories.items():
+        if keywords:
+            names.append(category)
+            groups.append('(' + '|'.join(re.escape(keyword) for keyword in keywords) + ')')
+    if not groups:
+        return names, None
+    return names, re.compile('(?=' + '|'.join(groups) + ')', re.IGNORECASE)
 
 class TransactionProcessor:
     """Processes transactions for double-entry accounting."""
     
+    # This would typically require a mapping of account references to account names
+    # For now, we'll use a simple heuristic based on the last digits
+    _REF_TO_ACCOUNT = {
+        'xx5784': 'credit_card',
+        'xx9070': 'debit',
+        'xx1893': 'emergency_fund',
+        'xx1212': 'old_credit_card',
+        'xx2467': 'saver',
+    }
+    
     def __init__(self, accounts=None, categories=None):
         """
         Initialize the transaction processor.
@@ -20,8 +70,41 @@ class TransactionProcessor:
         self.raw_transactions = []
         self.processed_transactions = []
         self.unified_transactions = []
+        # Running balances of every account, one row per unified transaction
+        self._balance_snapshots = np.empty((0, len(self.accounts)))
         self.account_balances = {account: 0 for account in self.accounts}
         self.pending_transfers = []
+        # Transfer candidates by absolute amount, only kept while processing
+        self._transfer_index = None
+    
+    @property
+    def accounts(self):
+        """dict: Account keys mapped to their name, type, id and api_type."""
+        return self._accounts
+    
+    @accounts.setter
+    def accounts(self, accounts):
+        # Rebuild the per-slot lookups whenever the accounts are replaced
+        self._accounts = accounts
+        self._account_ids = list(accounts)
+        self._account_index = {account: i for i, account in enumerate(self._account_ids)}
+        self._account_types = [details['type'] for details in accounts.values()]
+        self._account_names = [details.get('name') for details in accounts.values()]
+        # DEBIT increases ASSET/EXPENSE accounts, CREDIT increases LIABILITY,
+        # EQUITY and INCOME accounts
+        self._debit_increases = np.array([account_type in ('ASSET', 'EXPENSE') for account_type in self._account_types],
+                                         dtype=bool)
+    
+    @property
+    def categories(self):
+        """dict: Category names mapped to keyword lists, in matching priority order."""
+        return self._categories
+    
+    @categories.setter
+    def categories(self, categories):
+        # Rebuild the combined pattern whenever the categories are replaced
+        self._categories = categories
+        self._category_names, self._category_pattern = _compile_category_pattern(categories)
     
     def parse_date(self, date_str):
         """
@@ -92,14 +175,17 @@ class TransactionProcessor:
         Returns:
             str: Category name
         """
-        description_upper = description.upper()
+        if self._category_pattern is None:
+            return 'uncategorized'
         
-        for category, keywords in self.categories.items():
-            for keyword in keywords:
-                if keyword.upper() in description_upper:
-                    return category
+        best = None
+        for match in self._category_pattern.finditer(description):
+            if best is None or match.lastindex < best:
+                best = match.lastindex
+                if best == 1:
+                    break
         
-        return 'uncategorized'
+        return self._category_names[best - 1] if best else 'uncategorized'
     
     def is_transfer(self, description):
         """
@@ -111,17 +197,7 @@ class TransactionProcessor:
         Returns:
             bool: True if likely a transfer, False otherwise
         """
-        description_upper = description.upper()
-        
-        transfer_keywords = [
-            'TRANSFER TO', 'TRANSFER FROM', 'BPAY', 'NETBANK', 'COMMBANK APP'
-        ]
-        
-        for keyword in transfer_keywords:
-            if keyword.upper() in description_upper:
-                return True
-        
-        return False
+        return _TRANSFER_RE.search(description) is not None
     
     def extract_account_reference(self, description):
         """
@@ -133,11 +209,8 @@ class TransactionProcessor:
         Returns:
             str or None: Account reference or None if not found
         """
-        # Extract account numbers like xx1234
-        account_match = re.search(r'xx(\d+)', description)
-        if account_match:
-            return account_match.group(0)
-        return None
+        account_match = _ACCOUNT_REF_RE.search(description)
+        return account_match.group(0) if account_match else None
     
     def find_account_by_reference(self, account_reference):
         """
@@ -149,21 +222,7 @@ class TransactionProcessor:
         Returns:
             str or None: Account name or None if not found
         """
-        # This would typically require a mapping of account references to account names
-        # For now, we'll use a simple heuristic based on the last digits
-        if account_reference:
-            if account_reference == 'xx5784':
-                return 'credit_card'
-            elif account_reference == 'xx9070':
-                return 'debit'
-            elif account_reference == 'xx1893':
-                return 'emergency_fund'
-            elif account_reference == 'xx1212':
-                return 'old_credit_card'
-            elif account_reference == 'xx2467':
-                return 'saver'
-        
-        return None
+        return self._REF_TO_ACCOUNT.get(account_reference) if account_reference else None
     
     def find_matching_transfer(self, transaction, amount):
         """
@@ -183,54 +242,75 @@ class TransactionProcessor:
         date_range_start = transaction['date'] - timedelta(days=2)
         date_range_end = transaction['date'] + timedelta(days=2)
         
-        print(f"\nLooking for matching transfer:")
-        print(f"  Date: {transaction['date']}")
-        print(f"  Amount: ${abs(amount):.2f}")
-        print(f"  Description: {transaction['description']}")
+        logger.debug("Looking for matching transfer: date=%s amount=$%.2f description=%s",
+                     transaction['date'], abs(amount), transaction['description'])
+        
+        transfer_index = self._transfer_index
+        if transfer_index is None:
+            transfer_index = self._build_transfer_index()
         
-        for other_tx in self.raw_transactions:
+        # Only the same-amount candidates dated inside the window are scanned;
+        # the earliest loaded one wins, as in a scan over raw_transactions
+        candidates = transfer_index.get(abs(amount), ())
+        low = bisect_left(candidates, date_range_start, key=itemgetter(0))
+        high = bisect_right(candidates, date_range_end, key=itemgetter(0))
+        match = None
+        for _, position, other_tx in candidates[low:high]:
             if 'processed' in other_tx and other_tx['processed']:
                 continue
-                
-            if (other_tx['account'] != transaction['account'] and 
-                isinstance(other_tx['date'], datetime) and
-                date_range_start <= other_tx['date'] <= date_range_end and
-                abs(other_tx['amount']) == abs(amount) and
-                (other_tx['amount'] < 0) == (transaction['amount'] > 0)):
-                
-                print(f"  Found match:")
-                print(f"    Date: {other_tx['date']}")
-                print(f"    Amount: ${abs(other_tx['amount']):.2f}")
-                print(f"    Description: {other_tx['description']}")
-                return other_tx
-        
-        print("  No match found")
-        return None
+            
+            if (other_tx['account'] != transaction['account'] and
+                (other_tx['amount'] < 0) == (transaction['amount'] > 0) and
+                (match is None or position < match[0])):
+                match = (position, other_tx)
+        
+        if match is None:
+            logger.debug("No matching transfer found")
+            return None
+        
+        other_tx = match[1]
+        logger.debug("Found matching transfer: date=%s amount=$%.2f description=%s",
+                     other_tx['date'], abs(other_tx['amount']), other_tx['description'])
+        return other_tx
+    
+    def _build_transfer_index(self):
+        """
+        Index dated raw transactions for transfer matching.
+        
+        Returns:
+            dict: Absolute amount mapped to (date, load position, transaction)
+                tuples, sorted by date
+        """
+        transfer_index = defaultdict(list)
+        for position, transaction in enumerate(self.raw_transactions):
+            if isinstance(transaction['date'], datetime):
+                transfer_index[abs(transaction['amount'])].append((transaction['date'], position, transaction))
+        for candidates in transfer_index.values():
+            candidates.sort(key=itemgetter(0, 1))
+        return transfer_index
     
-    def _create_processed_transaction(self, transaction):
+    def _create_processed_transaction(self, transaction, transaction_id=None):
         """
         Create a processed transaction with appropriate double entries.
         
         Args:
             transaction (dict): Raw transaction
+            transaction_id (int, optional): UUID of the processed transaction as
+                an int, generated when not given
             
         Returns:
             dict: Processed transaction
         """
         # Create base transaction record
         processed_transaction = {
-            'id': str(uuid.uuid4()),
+            'id': transaction_id if transaction_id is not None else uuid.uuid4().int,
             'date': transaction['date'],
             'description': transaction['description'],
             'category': transaction['category'],
             'entries': []
         }
         
-        account = transaction['account']
-        amount = transaction['amount']
-        is_transfer = transaction['is_transfer']
-        account_reference = transaction['account_reference']
-        account_type = self.accounts[account]['type']
+        account_type = self._account_types[self._account_index[transaction['account']]]
         
         # Process based on account type
         if account_type == 'LIABILITY':
@@ -238,18 +318,19 @@ class TransactionProcessor:
         elif account_type == 'ASSET':
             self._process_asset_transaction(processed_transaction, transaction)
         
-        # Validate that debits equal credits
-        total_debits = sum(entry['amount'] for entry in processed_transaction['entries'] if entry['type'] == 'DEBIT')
-        total_credits = sum(entry['amount'] for entry in processed_transaction['entries'] if entry['type'] == 'CREDIT')
-        
-        if abs(total_debits - total_credits) > 0.01:
-            print(f"Warning: Transaction {processed_transaction['id']} is not balanced:")
-            print(f"  Description: {processed_transaction['description']}")
-            print(f"  Total Debits: ${total_debits:.2f}")
-            print(f"  Total Credits: ${total_credits:.2f}")
-            print(f"  Difference: ${abs(total_debits - total_credits):.2f}")
+        # Validate that debits equal credits: with credits counted negative the
+        # entries sum to zero, so one pass suffices for balanced transactions
+        entries = processed_transaction['entries']
+        imbalance = sum(entry['amount'] if entry['type'] == 'DEBIT' else -entry['amount'] for entry in entries)
+        
+        if abs(imbalance) > 0.01:
+            total_debits = sum(entry['amount'] for entry in entries if entry['type'] == 'DEBIT')
+            total_credits = sum(entry['amount'] for entry in entries if entry['type'] == 'CREDIT')
+            logger.warning("Transaction %s is not balanced: %s (debits $%.2f, credits $%.2f, difference $%.2f)",
+                           format_transaction_id(processed_transaction['id']), processed_transaction['description'],
+                           total_debits, total_credits, abs(total_debits - total_credits))
             for entry in processed_transaction['entries']:
-                print(f"  {entry['type']}: {entry['account']} ${entry['amount']:.2f}")
+                logger.warning("  %s: %s $%.2f", entry['type'], entry['account'], entry['amount'])
         
         return processed_transaction
     
@@ -273,7 +354,7 @@ class TransactionProcessor:
             
             # Handle the credit side of the transaction
             if is_transfer:
-                self._handle_transfer_credit(processed_transaction, transaction)
+                self._handle_transfer_credit(processed_transaction, transaction, 'LIABILITY')
             else:
                 # External payment source
                 self._add_entry(processed_transaction, 'transfer', amount, 'CREDIT')
@@ -289,7 +370,6 @@ class TransactionProcessor:
         account = transaction['account']
         amount = transaction['amount']
         is_transfer = transaction['is_transfer']
-        account_reference = transaction['account_reference']
         
         if amount < 0:  # Money going out
             # Handle the debit side of the transaction
@@ -306,7 +386,7 @@ class TransactionProcessor:
             
             # Handle the credit side of the transaction
             if is_transfer:
-                self._handle_transfer_credit(processed_transaction, transaction)
+                self._handle_transfer_credit(processed_transaction, transaction, 'ASSET')
             else:
                 # All incoming money is treated as income
                 self._add_entry(processed_transaction, 'income', amount, 'CREDIT')
@@ -332,20 +412,20 @@ class TransactionProcessor:
         # Default to transfer account if no specific destination found
         self._add_entry(processed_transaction, 'transfer', abs(amount), 'DEBIT')
     
-    def _handle_transfer_credit(self, processed_transaction, transaction):
+    def _handle_transfer_credit(self, processed_transaction, transaction, account_type):
         """
         Handle the credit side of a transfer transaction.
         
         Args:
             processed_transaction (dict): Processed transaction to add entries to
             transaction (dict): Raw transaction
+            account_type (str): Type of the transaction's account
         """
-        account = transaction['account']
         amount = transaction['amount']
         account_reference = transaction['account_reference']
         
         # For liability accounts, try to find matching transfer
-        if self.accounts[account]['type'] == 'LIABILITY':
+        if account_type == 'LIABILITY':
             matching_transfer = self.find_matching_transfer(transaction, amount)
             if matching_transfer:
                 self._add_entry(processed_transaction, matching_transfer['account'], amount, 'CREDIT')
@@ -378,34 +458,106 @@ class TransactionProcessor:
             'type': entry_type
         })
     
+    def _sort_by_date(self, transactions):
+        """
+        Sort transactions by date, keeping ones with unparsed dates last.
+        
+        Args:
+            transactions (list): Transactions whose date is a datetime, or the
+                original string where parsing failed
+            
+        Returns:
+            list: Dated transactions in date order followed by undated ones in
+                their original order
+        """
+        # Checking the date type once per transaction lets the sort use a C key
+        dated = [transaction for transaction in transactions if isinstance(transaction['date'], datetime)]
+        undated = [transaction for transaction in transactions if not isinstance(transaction['date'], datetime)]
+        dated.sort(key=itemgetter('date'))
+        dated.extend(undated)
+        return dated
+    
     def process_raw_transactions(self):
         """Process raw transactions into double-entry format."""
         # Sort transactions by date
-        sorted_transactions = sorted(self.raw_transactions, 
-                                   key=lambda x: x['date'] if isinstance(x['date'], datetime) else datetime.now())
+        sorted_transactions = self._sort_by_date(self.raw_transactions)
         
-        for transaction in sorted_transactions:
+        self._transfer_index = self._build_transfer_index()
+        transaction_ids = [transaction_id.int for transaction_id in uuid4_batch(len(sorted_transactions))]
+        
+        for transaction, transaction_id in zip(sorted_transactions, transaction_ids):
             # Skip already processed transactions
             if 'processed' in transaction and transaction['processed']:
                 continue
             
             # Process the transaction
-            processed_transaction = self._create_processed_transaction(transaction)
+            processed_transaction = self._create_processed_transaction(transaction, transaction_id)
             
             # Mark transaction as processed
             transaction['processed'] = True
             
             # Add to processed transactions
             self.processed_transactions.append(processed_transaction)
+        
+        # Raw transactions can be added after this, so don't keep a stale index
+        self._transfer_index = None
+    
+    def process_and_balance(self):
+        """
+        Process raw transactions and update account balances in one go.
+        
+        Equivalent to process_raw_transactions followed by
+        update_account_balances, but the newly processed transactions are
+        already in date order so they are balanced without sorting them again.
+        """
+        previously_processed = len(self.processed_transactions)
+        self.process_raw_transactions()
+        
+        if previously_processed:
+            # Earlier processed transactions interleave with the new ones by date
+            self.update_account_balances()
+        else:
+            self._balance_sorted_transactions(self.processed_transactions)
     
     def update_account_balances(self):
         """Update all account balances based on processed transactions."""
-        # Reset balances
-        self.account_balances = {account: 0 for account in self.accounts}
-        
         # Sort transactions by date
-        sorted_transactions = sorted(self.processed_transactions, 
-                                   key=lambda x: x['date'] if isinstance(x['date'], datetime) else datetime.now())
+        self._balance_sorted_transactions(self._sort_by_date(self.processed_transactions))
+    
+    def _balance_sorted_transactions(self, sorted_transactions):
+        """
+        Reset account balances and apply date-sorted processed transactions.
+        
+        Args:
+            sorted_transactions (list): Processed transactions sorted by date
+        """
+        account_ids = self._account_ids
+        account_index = self._account_index
+        account_names = self._account_names
+        
+        # Flatten the entries of known accounts into parallel arrays so the
+        # running balances come from one cumulative sum instead of a Python loop
+        positions = []
+        columns = []
+        amounts = []
+        is_debit = []
+        for position, transaction in enumerate(sorted_transactions):
+            for entry in transaction['entries']:
+                column = account_index.get(entry['account'])
+                if column is None:
+                    continue
+                positions.append(position)
+                columns.append(column)
+                amounts.append(entry['amount'])
+                is_debit.append(entry['type'] == 'DEBIT')
+        
+        columns = np.asarray(columns, dtype=np.intp)
+        amounts = np.asarray(amounts, dtype=float)
+        increases = self._debit_increases[columns] == np.asarray(is_debit, dtype=bool)
+        
+        deltas = np.zeros((len(sorted_transactions), len(account_ids)))
+        np.add.at(deltas, (np.asarray(positions, dtype=np.intp), columns), np.where(increases, amounts, -amounts))
+        running_balances = np.cumsum(deltas, axis=0)
         
         # Process each transaction
         for transaction in sorted_transactions:
@@ -415,44 +567,42 @@ class TransactionProcessor:
                 'date': transaction['date'].strftime('%Y-%m-%d') if isinstance(transaction['date'], datetime) else str(transaction['date']),
                 'description': transaction['description'],
                 'category': transaction['category'],
-                'entries': [],
-                'balances': {}
+                'entries': [
+                    {
+                        'account': entry['account'],
+                        'account_name': account_names[account_index[entry['account']]] if entry['account'] in account_index else "Unknown",
+                        'amount': entry['amount'],
+                        'type': entry['type']
+                    }
+                    for entry in transaction['entries']
+                ]
             }
             
-            # Process each entry in the transaction
-            for entry in transaction['entries']:
-                account = entry['account']
-                amount = entry['amount']
-                entry_type = entry['type']
-                
-                # Update account balance based on entry type and account type
-                if account in self.accounts:
-                    account_type = self.accounts[account]['type']
-                    
-                    if entry_type == 'DEBIT':
-                        if account_type in ['ASSET', 'EXPENSE']:
-                            self.account_balances[account] += amount
-                        else:  # LIABILITY, EQUITY, INCOME
-                            self.account_balances[account] -= amount
-                    else:  # CREDIT
-                        if account_type in ['ASSET', 'EXPENSE']:
-                            self.account_balances[account] -= amount
-                        else:  # LIABILITY, EQUITY, INCOME
-                            self.account_balances[account] += amount
-                
-                # Add entry to unified transaction
-                unified_transaction['entries'].append({
-                    'account': account,
-                    'account_name': self.accounts[account]['name'] if account in self.accounts else "Unknown",
-                    'amount': amount,
-                    'type': entry_type
-                })
-            
-            # Add the current balances to the transaction
-            unified_transaction['balances'] = self.account_balances.copy()
-            
             # Add the unified transaction to the list
             self.unified_transactions.append(unified_transaction)
+        
+        # One row per unified transaction; dicts are only built on request by balances_at
+        if len(self._balance_snapshots):
+            self._balance_snapshots = np.concatenate((self._balance_snapshots, running_balances))
+        else:
+            self._balance_snapshots = running_balances
+        
+        if len(running_balances):
+            self.account_balances = dict(zip(account_ids, running_balances[-1].tolist()))
+        else:
+            self.account_balances = {account: 0 for account in account_ids}
+    
+    def balances_at(self, position):
+        """
+        Return the account balances after a unified transaction.
+        
+        Args:
+            position (int): Index of the transaction in unified_transactions
+            
+        Returns:
+            dict: The balance of every account after that transaction
+        """
+        return dict(zip(self._account_ids, self._balance_snapshots[position].tolist()))
     
     def verify_double_entry_accounting(self, transactions):
         """
@@ -475,31 +625,34 @@ class TransactionProcessor:
         }
         
         print("\nVerifying double-entry accounting...")
-        print("Processing transactions chronologically:")
         
-        # Process all transactions
-        for transaction in transactions:
-            amount = transaction['amount']
-            account_id = transaction['account_id']
-            account_type = account_types.get(account_id)
-            
-            if account_id not in account_balances:
-                account_balances[account_id] = 0.0
-            
-            # For all transactions:
-            # - ASSET accounts: positive = debit (increase), negative = credit (decrease)
-            # - LIABILITY accounts: positive = credit (increase), negative = debit (decrease)
-            if account_type == 'LIABILITY':
-                # For liabilities, we invert the sign to match double-entry principles
-                amount = -amount
-            
-            account_balances[account_id] += amount
-            
-            print(f"\nTransaction: {transaction.get('description', 'Unknown')}")
-            print(f"  Date: {transaction.get('date', 'Unknown')}")
-            print(f"  Account: {account_id} ({account_type})")
-            print(f"  Amount: ${abs(amount):.2f}")
-            print(f"  Current balance: ${account_balances[account_id]:.2f}")
+        # Number the accounts in order of appearance and sum every account's
+        # signed amounts in one bincount rather than a per-transaction loop
+        account_index = {}
+        account_positions = np.fromiter(
+            (account_index.setdefault(transaction['account_id'], len(account_index)) for transaction in transactions),
+            dtype=np.intp, count=len(transactions))
+        amounts = np.fromiter((transaction['amount'] for transaction in transactions),
+                              dtype=float, count=len(transactions))
+        
+        # For all transactions:
+        # - ASSET accounts: positive = debit (increase), negative = credit (decrease)
+        # - LIABILITY accounts: positive = credit (increase), negative = debit (decrease)
+        # so liability amounts are inverted to match double-entry principles
+        is_liability = np.array([account_types.get(account_id) == 'LIABILITY' for account_id in account_index], dtype=bool)
+        amounts = np.where(is_liability[account_positions], -amounts, amounts)
+        
+        balances = np.bincount(account_positions, weights=amounts, minlength=len(account_index))
+        account_balances = dict(zip(account_index, balances.tolist()))
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            running_balances = dict.fromkeys(account_index, 0.0)
+            for transaction, amount in zip(transactions, amounts.tolist()):
+                account_id = transaction['account_id']
+                running_balances[account_id] += amount
+                logger.debug("Transaction %s on %s: %s (%s) $%.2f, balance $%.2f",
+                             transaction.get('description', 'Unknown'), transaction.get('date', 'Unknown'),
+                             account_id, account_types.get(account_id), abs(amount), running_balances[account_id])
         
         # Calculate total debits and credits
         total_debits = sum(balance for balance in account_balances.values() if balance > 0)
@@ -537,10 +690,10 @@ class TransactionProcessor:
         for transaction in self.unified_transactions:
             # Get the main entry details - prioritize real accounts over transfer/expense/income
             main_entry = next((entry for entry in transaction['entries'] 
-                             if entry['account'] in ['credit_card', 'debit', 'emergency_fund', 'saver', 'old_credit_card']), None)
+                             if entry['account'] in REAL_ACCOUNTS), None)
             
             if not main_entry:
-                main_entry = next((entry for entry in transaction['entries']), None)
+                main_entry = transaction['entries'][0] if transaction['entries'] else None
                 
             if not main_entry:
                 continue
@@ -551,7 +704,7 @@ class TransactionProcessor:
             
             # Find the affected real account
             for entry in transaction['entries']:
-                if entry['account'] in ['credit_card', 'debit', 'emergency_fund', 'saver', 'old_credit_card']:
+                if entry['account'] in REAL_ACCOUNTS:
                     source_account = entry['account']
                     # For assets, debits increase (+), credits decrease (-)
                     # For liabilities, debits decrease (+), credits increase (-)
@@ -578,7 +731,7 @@ class TransactionProcessor:
             
             up_transaction = {
                 "type": "transactions",
-                "id": transaction['id'],
+                "id": format_transaction_id(transaction['id']),
                 "attributes": {
                     "status": "SETTLED",
                     "rawText": transaction['description'],
@@ -613,7 +766,7 @@ class TransactionProcessor:
             is_transfer = any(entry['account'] == 'transfer' for entry in transaction['entries'])
             if is_transfer:
                 account_entries = [entry for entry in transaction['entries'] 
-                                  if entry['account'] in ['credit_card', 'debit', 'emergency_fund', 'saver', 'old_credit_card'] 
+                                  if entry['account'] in REAL_ACCOUNTS 
                                   and entry['account'] != source_account]
                 
                 if account_entries:
@@ -26,7 +26,8 @@ def main():
         print(f"Using CommBank data from: {commbank_dir}")
         
         # Load transactions from all accounts
-        all_transactions = file_loader.load_all_accounts(commbank_dir)
+        transactions_frame = file_loader.load_all_accounts_frame(commbank_dir)
+        all_transactions = transactions_frame.to_dict('records')
         
         # Verify that all transactions follow double-entry principles
         is_valid = processor.verify_double_entry_accounting(all_transactions)
@@ -40,18 +41,10 @@ def main():
         # Print some statistics about the transactions
         print(f"\nLoaded {len(all_transactions)} transactions")
         
-        # Group transactions by account
-        account_transactions = {}
-        for transaction in all_transactions:
-            account_id = transaction['account_id']
-            if account_id not in account_transactions:
-                account_transactions[account_id] = []
-            account_transactions[account_id].append(transaction)
-        
         # Print transaction counts by account
         print("\nTransactions by account:")
-        for account_id, transactions in account_transactions.items():
-            print(f"{account_id}: {len(transactions)} transactions")
+        for account_id, count in transactions_frame.groupby('account_id', sort=False).size().items():
+            print(f"{account_id}: {count} transactions")
             
     except Exception as e:
         print(f"Error validating double-entry accounting: {str(e)}")
@@ -1,67 +1,90 @@
-import json
-import uuid
-from collections import defaultdict
+import orjson
+import pandas as pd
+
+from financial_planning.helpers import format_cents, uuid4_batch
+
+# Shared default for missing nested objects, so lookups don't allocate a dict
+_EMPTY = {}
 
 def load_json_file(filepath):
     """Load JSON data from a file"""
     try:
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
     except Exception as e:
         print(f"Error loading {filepath}: {str(e)}")
         return None
 
 def save_json_file(data, filepath):
     """Save JSON data to a file"""
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2)
+    with open(filepath, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
     print(f"Saved data to {filepath}")
 
 def generate_accounts(transactions_file):
     """Generate accounts data from transactions"""
-    # Load transactions
     transactions = load_json_file(transactions_file)
     if not transactions:
         return None
-    
-    # Extract unique accounts
+    return _aggregate(transactions.get('data', []))
+
+def _make_account(account_name, account_details):
+    """Build an account record with a zero balance from a transaction's account details"""
+    return {
+        "type": "accounts",
+        # Assigned once every account is known, see _aggregate
+        "id": None,
+        "attributes": {
+            "displayName": account_name,
+            "accountType": account_details.get('accountType', 'UNKNOWN'),
+            "ownershipType": account_details.get('ownershipType', 'INDIVIDUAL'),
+            "balance": {
+                "currencyCode": "AUD",
+                "value": "0.00",
+                "valueInBaseUnits": 0
+            }
+        }
+    }
+
+def _aggregate(transactions):
+    """Build the accounts payload from an iterable of transactions"""
+    # Extract unique accounts, collecting each transaction's account and amount
+    # so the balances are summed in one groupby rather than row by row
     accounts = {}
-    account_balances = defaultdict(float)
+    account_names = []
+    amounts = []
+    append_name = account_names.append
+    append_amount = amounts.append
     
-    for tx in transactions.get('data', []):
-        account_details = tx.get('accountDetails', {})
+    for tx in transactions:
+        account_details = tx.get('accountDetails')
         if not account_details:
             continue
             
-        account_name = account_details.get('displayName', '')
+        account_name = account_details.get('displayName')
         if not account_name:
             continue
             
         # Create account if not exists
         if account_name not in accounts:
-            accounts[account_name] = {
-                "type": "accounts",
-                "id": str(uuid.uuid4()),
-                "attributes": {
-                    "displayName": account_name,
-                    "accountType": account_details.get('accountType', 'UNKNOWN'),
-                    "ownershipType": account_details.get('ownershipType', 'INDIVIDUAL'),
-                    "balance": {
-                        "currencyCode": "AUD",
-                        "value": "0.00",
-                        "valueInBaseUnits": 0
-                    }
-                }
-            }
+            accounts[account_name] = _make_account(account_name, account_details)
         
-        # Update balance
-        amount = float(tx.get('attributes', {}).get('amount', {}).get('value', '0'))
-        account_balances[account_name] += amount
+        append_name(account_name)
+        append_amount(tx.get('attributes', _EMPTY).get('amount', _EMPTY).get('value', '0'))
+    
+    for account, account_id in zip(accounts.values(), uuid4_batch(len(accounts))):
+        account['id'] = str(account_id)
+    
+    # Sum whole cents so the total doesn't depend on float summation order
+    cents = (pd.to_numeric(pd.Series(amounts, dtype=object)).to_numpy(dtype=float) * 100).round().astype('int64')
+    account_balances = pd.Series(cents, index=account_names).groupby(level=0, sort=False).sum()
     
     # Update balances in accounts
-    for account_name, balance in account_balances.items():
-        accounts[account_name]['attributes']['balance']['value'] = f"{balance:.2f}"
-        accounts[account_name]['attributes']['balance']['valueInBaseUnits'] = int(balance * 100)
+    for account_name, balance_cents in account_balances.items():
+        balance_cents = int(balance_cents)
+        balance = accounts[account_name]['attributes']['balance']
+        balance['value'] = format_cents(balance_cents)
+        balance['valueInBaseUnits'] = balance_cents
     
     return {
         "data": list(accounts.values()),
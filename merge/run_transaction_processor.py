@@ -30,8 +30,7 @@ def main():
     })
     
     # Process transactions
-    processor.process_raw_transactions()
-    processor.update_account_balances()
+    processor.process_and_balance()
     
     # Verify double-entry accounting
     is_balanced = processor.verify_double_entry_accounting()
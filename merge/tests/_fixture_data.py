@@ -0,0 +1,67 @@
+"""Read-only sample data shared by the test fixtures, built once per session."""
+from types import MappingProxyType
+
+SAMPLE_ACCOUNTS = MappingProxyType({
+    'credit_card': MappingProxyType({'name': 'Credit Card', 'type': 'LIABILITY', 'id': '123', 'api_type': 'TRANSACTIONAL'}),
+    'debit': MappingProxyType({'name': 'Debit Account', 'type': 'ASSET', 'id': '456', 'api_type': 'TRANSACTIONAL'}),
+    'emergency_fund': MappingProxyType({'name': 'Emergency Fund', 'type': 'ASSET', 'id': '789', 'api_type': 'SAVER'}),
+    'old_credit_card': MappingProxyType({'name': 'Old Credit Card', 'type': 'LIABILITY', 'id': '101', 'api_type': 'TRANSACTIONAL'}),
+    'saver': MappingProxyType({'name': 'Savings Account', 'type': 'ASSET', 'id': '102', 'api_type': 'SAVER'}),
+    'expense': MappingProxyType({'name': 'Expenses', 'type': 'EXPENSE', 'id': None, 'api_type': None}),
+    'income': MappingProxyType({'name': 'Income', 'type': 'INCOME', 'id': None, 'api_type': None}),
+    'transfer': MappingProxyType({'name': 'Internal Transfers', 'type': 'EQUITY', 'id': None, 'api_type': None}),
+})
+
+SAMPLE_CATEGORIES = MappingProxyType({
+    'groceries': (
+        'WOOLWORTHS', 'COLES', 'IGA', 'ALDI', 'SPUDSHED', 'WA GROWERS', 'COSTCO'
+    ),
+    'dining': (
+        'MCDONALDS', 'SUBWAY', 'HUNGRY JACKS', 'NANDOS', 'GUZMAN Y GOMEZ', 'KFC', 
+        'ZAMBRERO', 'BOOST JUICE', 'MUFFIN BREAK', 'CHICKEN TREAT', 'CAFE', 
+        'RESTAURANT', 'FOOD', 'MUZZ BUZZ', 'BASKIN', 'BAKERY', 'PIZZ'
+    ),
+    'shopping': (
+        'KMART', 'TARGET', 'MYER', 'DAVID JONES', 'BIG W', 'BUNNINGS', 'OFFICEWORKS',
+        'JB HI-FI', 'HARVEY NORMAN', 'IKEA', 'RED DOT', 'PETBARN', 'PET CIRCLE'
+    ),
+    'transport': (
+        'FUEL', 'PETROL', 'BP ', 'CALTEX', 'SHELL', 'UBER', 'TRANSPORT', 'TAXI',
+        'PARKING', 'CAR', 'AUTO', 'DEPARTMENT OF TRANSPOR'
+    ),
+    'utilities': (
+        'ORIGIN ENERGY', 'SYNERGY', 'WATER CORPORATION', 'INTERNET', 'PHONE',
+        'OPTUS', 'TELSTRA', 'VODAFONE', 'NBN', 'Aussie Broadband', 'Superloop'
+    ),
+    'health': (
+        'CHEMIST', 'PHARMACY', 'DOCTOR', 'MEDICAL', 'DENTAL', 'HEALTH', 'HOSPITAL'
+    ),
+    'entertainment': (
+        'CINEMA', 'MOVIE', 'THEATRE', 'NETFLIX', 'SPOTIFY', 'APPLE.COM', 'GOOGLE PLAY',
+        'AMAZON', 'STEAM', 'PATREON', 'DISCORD', 'APPLE MUSIC', 'DISNEY+'
+    ),
+    'fitness': (
+        'GYM', 'FITNESS', 'SPORT', 'SWIM', 'GOLDSGYM'
+    ),
+    'income': (
+        'PAYMENT RECEIVED', 'SALARY', 'INCOME', 'DIVIDEND', 'INTEREST', 'REFUND',
+        'TAX RETURN', 'CASH DEPOSIT', 'DIRECT CREDIT'
+    ),
+    'transfers': (
+        'TRANSFER', 'BPAY', 'PAY ANYONE', 'NETBANK'
+    )
+})
+
+# The smaller account and category sets the processor and exporter tests use
+BASIC_ACCOUNTS = MappingProxyType({
+    'credit_card': MappingProxyType({'name': 'Credit Card', 'type': 'LIABILITY', 'id': '123', 'api_type': 'TRANSACTIONAL'}),
+    'debit': MappingProxyType({'name': 'Debit Account', 'type': 'ASSET', 'id': '456', 'api_type': 'TRANSACTIONAL'}),
+    'expense': MappingProxyType({'name': 'Expenses', 'type': 'EXPENSE', 'id': None, 'api_type': None}),
+    'income': MappingProxyType({'name': 'Income', 'type': 'INCOME', 'id': None, 'api_type': None}),
+})
+
+BASIC_CATEGORIES = MappingProxyType({
+    'income': ('PAYMENT RECEIVED', 'SALARY', 'INCOME'),
+    'groceries': ('WOOLWORTHS', 'COLES', 'IGA'),
+    'dining': ('MCDONALDS', 'SUBWAY', 'RESTAURANT'),
+})
@@ -2,60 +2,15 @@ import pytest
 import os
 from datetime import datetime
 
-@pytest.fixture
+from tests._fixture_data import SAMPLE_ACCOUNTS, SAMPLE_CATEGORIES
+
+@pytest.fixture(scope='session')
 def sample_accounts():
-    return {
-        'credit_card': {'name': 'Credit Card', 'type': 'LIABILITY', 'id': '123', 'api_type': 'TRANSACTIONAL'},
-        'debit': {'name': 'Debit Account', 'type': 'ASSET', 'id': '456', 'api_type': 'TRANSACTIONAL'},
-        'emergency_fund': {'name': 'Emergency Fund', 'type': 'ASSET', 'id': '789', 'api_type': 'SAVER'},
-        'old_credit_card': {'name': 'Old Credit Card', 'type': 'LIABILITY', 'id': '101', 'api_type': 'TRANSACTIONAL'},
-        'saver': {'name': 'Savings Account', 'type': 'ASSET', 'id': '102', 'api_type': 'SAVER'},
-        'expense': {'name': 'Expenses', 'type': 'EXPENSE', 'id': None, 'api_type': None},
-        'income': {'name': 'Income', 'type': 'INCOME', 'id': None, 'api_type': None},
-        'transfer': {'name': 'Internal Transfers', 'type': 'EQUITY', 'id': None, 'api_type': None},
-    }
+    return SAMPLE_ACCOUNTS
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_categories():
-    return {
-        'groceries': [
-            'WOOLWORTHS', 'COLES', 'IGA', 'ALDI', 'SPUDSHED', 'WA GROWERS', 'COSTCO'
-        ],
-        'dining': [
-            'MCDONALDS', 'SUBWAY', 'HUNGRY JACKS', 'NANDOS', 'GUZMAN Y GOMEZ', 'KFC', 
-            'ZAMBRERO', 'BOOST JUICE', 'MUFFIN BREAK', 'CHICKEN TREAT', 'CAFE', 
-            'RESTAURANT', 'FOOD', 'MUZZ BUZZ', 'BASKIN', 'BAKERY', 'PIZZ'
-        ],
-        'shopping': [
-            'KMART', 'TARGET', 'MYER', 'DAVID JONES', 'BIG W', 'BUNNINGS', 'OFFICEWORKS',
-            'JB HI-FI', 'HARVEY NORMAN', 'IKEA', 'RED DOT', 'PETBARN', 'PET CIRCLE'
-        ],
-        'transport': [
-            'FUEL', 'PETROL', 'BP ', 'CALTEX', 'SHELL', 'UBER', 'TRANSPORT', 'TAXI',
-            'PARKING', 'CAR', 'AUTO', 'DEPARTMENT OF TRANSPOR'
-        ],
-        'utilities': [
-            'ORIGIN ENERGY', 'SYNERGY', 'WATER CORPORATION', 'INTERNET', 'PHONE',
-            'OPTUS', 'TELSTRA', 'VODAFONE', 'NBN', 'Aussie Broadband', 'Superloop'
-        ],
-        'health': [
-            'CHEMIST', 'PHARMACY', 'DOCTOR', 'MEDICAL', 'DENTAL', 'HEALTH', 'HOSPITAL'
-        ],
-        'entertainment': [
-            'CINEMA', 'MOVIE', 'THEATRE', 'NETFLIX', 'SPOTIFY', 'APPLE.COM', 'GOOGLE PLAY',
-            'AMAZON', 'STEAM', 'PATREON', 'DISCORD', 'APPLE MUSIC', 'DISNEY+'
-        ],
-        'fitness': [
-            'GYM', 'FITNESS', 'SPORT', 'SWIM', 'GOLDSGYM'
-        ],
-        'income': [
-            'PAYMENT RECEIVED', 'SALARY', 'INCOME', 'DIVIDEND', 'INTEREST', 'REFUND',
-            'TAX RETURN', 'CASH DEPOSIT', 'DIRECT CREDIT'
-        ],
-        'transfers': [
-            'TRANSFER', 'BPAY', 'PAY ANYONE', 'NETBANK'
-        ]
-    }
+    return SAMPLE_CATEGORIES
 
 @pytest.fixture
 def sample_transaction():
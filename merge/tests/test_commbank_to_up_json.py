@@ -0,0 +1,62 @@
+import pytest
+
+import commbank_to_up_json
+from commbank_to_up_json import (merge_accounts, merge_transactions, match_transaction_keys,
+                                 match_transaction_keys_frame, _join_key)
+
+def _transaction(tx_id, settled_at, value):
+    return {
+        'type': 'transactions',
+        'id': tx_id,
+        'attributes': {'settledAt': settled_at, 'amount': {'currencyCode': 'AUD', 'value': value}}
+    }
+
+OUR_TRANSACTIONS = [
+    _transaction('ours-1', '2024-01-02T00:00:00+10:00', '-12.3'),
+    _transaction('ours-2', '2024-01-02T00:00:00+10:00', '-12.30'),
+    _transaction('ours-3', '2024-01-03T00:00:00+10:00', 'n/a'),
+    _transaction('ours-4', '2024-01-04T00:00:00+10:00', '5.00'),
+    _transaction('ours-5', '2024-01-05T00:00:00+10:00', '7.00'),
+]
+
+UPBANK_TRANSACTIONS = [
+    _transaction('up-1', '2024-01-02T09:30:00+10:00', '-12.30'),
+    _transaction('up-2', '2024-01-03T09:30:00+10:00', 'n/a'),
+    _transaction('up-3', '2024-01-04T09:30:00+10:00', '5'),
+    _transaction('up-4', '2024-01-02T10:00:00+10:00', '-12.30'),
+    _transaction('up-5', '2024-01-06T10:00:00+10:00', '7.00'),
+]
+
+@pytest.mark.parametrize('match', [match_transaction_keys, match_transaction_keys_frame])
+def test_match_transaction_keys(match):
+    our_keys = [_join_key(tx['attributes']) for tx in OUR_TRANSACTIONS]
+    upbank_keys = [_join_key(tx['attributes']) for tx in UPBANK_TRANSACTIONS]
+
+    # Repeated keys pair up in order and non-numeric amounts never match
+    assert match(our_keys, upbank_keys) == [0, 3, -1, 2, -1]
+
+@pytest.mark.parametrize('threshold', [0, 50_000])
+def test_merge_transactions_join_paths(monkeypatch, threshold):
+    monkeypatch.setattr(commbank_to_up_json, 'FRAME_JOIN_THRESHOLD', threshold)
+
+    merged = merge_transactions({'data': OUR_TRANSACTIONS}, {'transactions': UPBANK_TRANSACTIONS})
+
+    assert [tx['id'] for tx in merged['data']] == ['up-5', 'ours-5', 'up-3', 'up-2', 'ours-3', 'up-4', 'up-1']
+
+def _account(name, balance='0.00'):
+    return {
+        'type': 'accounts',
+        'id': f'id-{name}',
+        'attributes': {'displayName': name, 'balance': {'currencyCode': 'AUD', 'value': balance}}
+    }
+
+def test_merge_accounts_null_display_name():
+    unnamed = _account(None)
+    our_accounts = {'data': [_account('Debit Account', '10.00'), unnamed]}
+    upbank_accounts = {'accounts': [_account('Debit Account'), _account(None)]}
+
+    merged = merge_accounts(our_accounts, upbank_accounts)['data']
+
+    assert len(merged) == 2
+    assert merged[0]['attributes']['balance']['value'] == '10.00'
+    assert merged[1]['id'] == 'id-None'
@@ -0,0 +1,53 @@
+import pytest
+from datetime import datetime
+
+from commbank_tools import EnhancedDoubleEntryAccountingSystem
+
+@pytest.fixture
+def statement_file(tmp_path):
+    filepath = tmp_path / 'CBA_DEBIT.csv'
+    filepath.write_text(
+        '01/02/2024,-5.00,"WOOLWORTHS 1234",100.00\n'
+        '02/02/2024,-8.00,"COLES, PERTH",92.00,EXTRA\n'
+        '03/02/2024,-7.00\n'
+        '04/02/2024,0.00,"ZERO AMOUNT",92.00\n'
+        '05/02/2024,"(1,250.50)","TRANSFER TO xx2467",\n'
+    )
+    return str(filepath)
+
+@pytest.fixture
+def credit_card_file(tmp_path):
+    filepath = tmp_path / 'CBA_CC.csv'
+    filepath.write_text(
+        '01/02/2024,-5.00,"KFC"\n'
+        '02/02/2024,+80.05,"BPAY PAYMENT xx5784"\n'
+    )
+    return str(filepath)
+
+def test_read_statement_malformed_rows(statement_file):
+    accounting_system = EnhancedDoubleEntryAccountingSystem()
+    statement = accounting_system.read_statement(statement_file)
+
+    # The extra field is ignored and the short row, with no description, dropped
+    assert statement['description'].tolist() == ['WOOLWORTHS 1234', 'COLES, PERTH', 'TRANSFER TO xx2467']
+    assert statement['amount'].tolist() == [-5.0, -8.0, -1250.5]
+    assert statement['balance'].tolist() == [100.0, 92.0, None]
+    assert statement['date'].tolist()[0] == datetime(2024, 2, 1)
+    assert statement['date_iso'].tolist() == ['2024-02-01', '2024-02-02', '2024-02-05']
+
+def test_read_statement_without_balance(credit_card_file):
+    accounting_system = EnhancedDoubleEntryAccountingSystem()
+    statement = accounting_system.read_statement(credit_card_file)
+
+    assert statement['description'].tolist() == ['KFC', 'BPAY PAYMENT xx5784']
+    assert statement['amount'].tolist() == [-5.0, 80.05]
+
+def test_load_bank_account(statement_file):
+    accounting_system = EnhancedDoubleEntryAccountingSystem()
+    accounting_system.load_bank_account(statement_file, 'debit')
+
+    transactions = accounting_system.raw_transactions
+    assert [tx.description for tx in transactions] == ['WOOLWORTHS 1234', 'COLES, PERTH', 'TRANSFER TO xx2467']
+    assert [tx.category for tx in transactions] == ['groceries', 'groceries', 'transfers']
+    assert transactions[2].is_transfer
+    assert transactions[2].account_reference == 'xx2467'
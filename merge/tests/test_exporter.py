@@ -3,7 +3,8 @@ import json
 import os
 from unittest.mock import patch, MagicMock, mock_open
 
-from financial_planning.exporter import Exporter
+from financial_planning.exporter import Exporter, WRITE_BUFFER_SIZE, format_cents, to_cents
+from tests._fixture_data import BASIC_ACCOUNTS
 
 @pytest.fixture
 def sample_transactions():
@@ -21,14 +22,9 @@ def sample_transactions():
         }
     ]
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_accounts():
-    return {
-        'credit_card': {'name': 'Credit Card', 'type': 'LIABILITY', 'id': '123', 'api_type': 'TRANSACTIONAL'},
-        'debit': {'name': 'Debit Account', 'type': 'ASSET', 'id': '456', 'api_type': 'TRANSACTIONAL'},
-        'expense': {'name': 'Expenses', 'type': 'EXPENSE', 'id': None, 'api_type': None},
-        'income': {'name': 'Income', 'type': 'INCOME', 'id': None, 'api_type': None},
-    }
+    return BASIC_ACCOUNTS
 
 @pytest.fixture
 def sample_account_balances():
@@ -52,6 +48,17 @@ def test_prepare_transactions_for_up_bank(sample_transactions, sample_accounts):
     assert up_transactions[0]['attributes']['category'] == 'income'
     assert up_transactions[0]['relationships']['account']['data']['id'] == '456'
 
+def test_amount_cents_are_rounded(sample_transactions, sample_accounts):
+    sample_transactions[0]['entries'][0]['amount'] = 0.29
+    exporter = Exporter(sample_accounts)
+    
+    amount = exporter.prepare_transactions_for_up_bank(sample_transactions)[0]['attributes']['amount']
+    
+    assert amount['value'] == '0.29'
+    assert amount['valueInBaseUnits'] == 29
+    assert to_cents(-1000.0) == -100000
+    assert format_cents(-5) == '-0.05'
+
 def test_prepare_accounts_for_up_bank(sample_accounts, sample_account_balances):
     exporter = Exporter()
     exporter.accounts = sample_accounts
@@ -77,14 +84,14 @@ def test_export_to_json(sample_transactions, sample_accounts, sample_account_bal
         
         exporter.export_to_json(sample_transactions, 'transactions.json', 'accounts.json')
         
-        # Check that json.dump was called twice
+        # Check that both files were written
         assert mock_file.call_count == 2
         
         # Check the first call (transactions)
-        mock_file.assert_any_call('transactions.json', 'w')
+        mock_file.assert_any_call('transactions.json', 'wb', buffering=WRITE_BUFFER_SIZE)
         
         # Check the second call (accounts)
-        mock_file.assert_any_call('accounts.json', 'w')
+        mock_file.assert_any_call('accounts.json', 'wb', buffering=WRITE_BUFFER_SIZE)
 
 def test_export_account_balances(sample_accounts, sample_account_balances):
     with patch('builtins.print') as mock_print:
@@ -4,7 +4,9 @@ import csv
 from datetime import datetime
 from unittest.mock import patch, MagicMock, mock_open
 
-from financial_planning.file_loader import FileLoader
+import pandas as pd
+
+from financial_planning.file_loader import FileLoader, parse_amounts
 
 @pytest.fixture
 def sample_csv_data():
@@ -13,104 +15,118 @@ def sample_csv_data():
 02/01/2023,-50.00,WOOLWORTHS,950.00
 03/01/2023,-30.00,MCDONALDS,920.00"""
 
-@pytest.fixture
-def sample_transaction_processor():
-    processor = MagicMock()
-    processor.parse_date.return_value = datetime(2023, 1, 1)
-    processor.parse_amount.return_value = 100.0
-    processor.clean_description.return_value = "PAYMENT RECEIVED"
-    processor.categorize_transaction.return_value = "income"
-    processor.is_transfer.return_value = False
-    processor.extract_account_reference.return_value = None
-    return processor
-
-def test_find_latest_commbank_dir():
-    with patch('os.listdir') as mock_listdir, \
-         patch('os.path.isdir') as mock_isdir, \
-         patch('os.path.join') as mock_join:
-        
-        # Mock directory structure
-        mock_listdir.return_value = ['14-03-2025', '13-03-2025', '12-03-2025']
-        mock_isdir.return_value = True
-        mock_join.side_effect = lambda *args: '/'.join(args)
-        
-        loader = FileLoader()
-        latest_dir = loader.find_latest_commbank_dir('/path/to/commbank_csv')
-        
-        assert latest_dir == '14-03-2025'
-        mock_listdir.assert_called_once_with('/path/to/commbank_csv')
-        assert mock_isdir.call_count == 3
+def test_find_latest_commbank_dir(tmp_path):
+    for name in ['14-03-2025', '13-03-2025', '12-03-2025', '15-03-2025_bak']:
+        (tmp_path / name).mkdir()
+    (tmp_path / '16-03-2025').write_text('not a directory')
+    
+    loader = FileLoader()
+    latest_dir = loader.find_latest_commbank_dir(str(tmp_path))
+    
+    assert latest_dir == '14-03-2025'
 
-def test_load_credit_card(sample_csv_data, sample_transaction_processor):
-    with patch('builtins.open', mock_open(read_data=sample_csv_data)), \
-         patch('csv.reader') as mock_csv_reader:
-        
-        # Mock CSV reader
-        mock_csv_reader.return_value = [
-            ['Date', 'Amount', 'Description', 'Balance'],
-            ['01/01/2023', '100.00', 'PAYMENT RECEIVED', '1000.00'],
-            ['02/01/2023', '-50.00', 'WOOLWORTHS', '950.00'],
-            ['03/01/2023', '-30.00', 'MCDONALDS', '920.00']
-        ]
-        
-        loader = FileLoader()
-        loader.transaction_processor = sample_transaction_processor
-        
-        transactions = loader.load_credit_card('test.csv', 'credit_card')
-        
-        assert len(transactions) == 3
-        assert sample_transaction_processor.parse_date.call_count == 3
-        assert sample_transaction_processor.parse_amount.call_count == 3
-        assert sample_transaction_processor.clean_description.call_count == 3
-        assert sample_transaction_processor.categorize_transaction.call_count == 3
-        assert sample_transaction_processor.is_transfer.call_count == 3
-        assert sample_transaction_processor.extract_account_reference.call_count == 3
-
-def test_load_bank_account(sample_csv_data, sample_transaction_processor):
-    with patch('builtins.open', mock_open(read_data=sample_csv_data)), \
-         patch('csv.reader') as mock_csv_reader:
-        
-        # Mock CSV reader
-        mock_csv_reader.return_value = [
-            ['Date', 'Amount', 'Description', 'Balance'],
-            ['01/01/2023', '100.00', 'PAYMENT RECEIVED', '1000.00'],
-            ['02/01/2023', '-50.00', 'WOOLWORTHS', '950.00'],
-            ['03/01/2023', '-30.00', 'MCDONALDS', '920.00']
-        ]
-        
-        loader = FileLoader()
-        loader.transaction_processor = sample_transaction_processor
-        
-        transactions = loader.load_bank_account('test.csv', 'debit')
-        
-        assert len(transactions) == 3
-        assert sample_transaction_processor.parse_date.call_count == 3
-        assert sample_transaction_processor.parse_amount.call_count == 3
-        assert sample_transaction_processor.clean_description.call_count == 3
-        assert sample_transaction_processor.categorize_transaction.call_count == 3
-        assert sample_transaction_processor.is_transfer.call_count == 3
-        assert sample_transaction_processor.extract_account_reference.call_count == 3
+def test_find_latest_commbank_dir_empty(tmp_path):
+    loader = FileLoader()
+    
+    with pytest.raises(ValueError):
+        loader.find_latest_commbank_dir(str(tmp_path))
+
+def test_load_credit_card(sample_csv_data, tmp_path):
+    csv_path = tmp_path / 'CBA_CC.csv'
+    csv_path.write_text(sample_csv_data)
+    
+    loader = FileLoader()
+    
+    transactions = loader.load_credit_card(str(csv_path), 'credit_card')
+    
+    assert len(transactions) == 3
+    assert transactions[0] == {
+        'date': datetime(2023, 1, 1),
+        'amount': 100.0,
+        'description': 'PAYMENT RECEIVED',
+        'account_id': 'credit_card'
+    }
+    assert transactions[1]['amount'] == -50.0
+    assert transactions[2]['date'] == datetime(2023, 1, 3)
+
+def test_load_bank_account(tmp_path):
+    csv_path = tmp_path / 'CBA_DEBIT.csv'
+    csv_path.write_text("""Date,Amount,Description,Balance
+01/01/2023,"1,000.00",SALARY,1000.00
+02/01/2023,0.00,ZERO AMOUNT,1000.00
+not a date,(50.00),REFUND,950.00""")
+    
+    loader = FileLoader()
+    
+    transactions = loader.load_bank_account(str(csv_path), 'debit')
+    
+    assert len(transactions) == 2  # Zero amounts are skipped
+    assert transactions[0]['amount'] == 1000.0
+    assert transactions[0]['account_id'] == 'debit'
+    assert transactions[1]['date'] == 'not a date'
+    assert transactions[1]['amount'] == -50.0
+
+def test_load_statement_ragged_rows(tmp_path):
+    csv_path = tmp_path / 'CBA_DEBIT.csv'
+    csv_path.write_text("""Date,Amount,Description,Balance
+01/01/2023,-5.00,WOOLWORTHS,995.00
+02/01/2023,-8.00,COLES,987.00,EXTRA
+03/01/2023,-7.00""")
+
+    loader = FileLoader()
+
+    transactions = loader.load_statement(str(csv_path), 'debit')
+
+    # Extra fields are ignored rather than failing the whole file
+    assert [tx['description'] for tx in transactions] == ['WOOLWORTHS', 'COLES', '']
+    assert [tx['amount'] for tx in transactions] == [-5.0, -8.0, -7.0]
+    assert transactions[1]['date'] == datetime(2023, 1, 2)
+
+def test_load_statement_without_balance(tmp_path):
+    csv_path = tmp_path / 'CBA_CC.csv'
+    csv_path.write_text("""Date,Amount,Description
+01/01/2023,-5.00,KFC
+02/01/2023,+80.05,BPAY PAYMENT""")
+
+    loader = FileLoader()
+
+    transactions = loader.load_statement(str(csv_path), 'credit_card')
+
+    assert [tx['amount'] for tx in transactions] == [-5.0, 80.05]
+
+def test_load_missing_file():
+    loader = FileLoader()
+    
+    assert loader.load_credit_card('/path/to/missing.csv', 'credit_card') == []
 
 def test_load_all_accounts():
-    with patch('financial_planning.file_loader.FileLoader.load_credit_card') as mock_load_cc, \
-         patch('financial_planning.file_loader.FileLoader.load_bank_account') as mock_load_bank, \
-         patch('os.listdir') as mock_listdir, \
-         patch('os.path.isdir') as mock_isdir, \
-         patch('os.path.join') as mock_join:
-        
-        # Mock directory structure
-        mock_listdir.return_value = ['14-03-2025']
-        mock_isdir.return_value = True
-        mock_join.side_effect = lambda *args: '/'.join(args)
-        
-        mock_load_cc.return_value = [{'id': '1'}, {'id': '2'}]
-        mock_load_bank.return_value = [{'id': '3'}, {'id': '4'}]
+    with patch('financial_planning.file_loader.FileLoader.load_statement') as mock_load_statement:
+        mock_load_statement.return_value = [{'id': '1'}, {'id': '2'}]
         
         loader = FileLoader()
-        loader.transaction_processor = MagicMock()
         
         transactions = loader.load_all_accounts('/path/to/data')
         
-        assert len(transactions) == 10  # 2 credit cards * 2 transactions + 3 bank accounts * 2 transactions
-        assert mock_load_cc.call_count == 2  # Called for both credit cards
-        assert mock_load_bank.call_count == 3  # Called for debit, emergency fund, and saver 
\ No newline at end of file
+        assert len(transactions) == 10  # 5 statements * 2 transactions
+        assert mock_load_statement.call_count == 5
+        mock_load_statement.assert_any_call('/path/to/data/CBA_CC.csv', 'credit_card')
+        mock_load_statement.assert_any_call('/path/to/data/CBA_SAVER.csv', 'saver')
+
+def test_load_all_accounts_frame(sample_csv_data, tmp_path):
+    (tmp_path / 'CBA_CC.csv').write_text(sample_csv_data)
+    (tmp_path / 'CBA_SAVER.csv').write_text(sample_csv_data)
+    
+    loader = FileLoader()
+    
+    frame = loader.load_all_accounts_frame(str(tmp_path))  # Missing files are skipped
+    
+    assert list(frame.columns) == ['date', 'amount', 'description', 'account_id']
+    assert len(frame) == 6
+    assert frame.groupby('account_id').size().to_dict() == {'credit_card': 3, 'saver': 3}
+    assert frame['amount'].sum() == pytest.approx(40.0)
+
+def test_parse_amounts():
+    amounts = pd.Series(['1,000.50', '(12.50)', '"-3"', '1_000', 'invalid'])
+    
+    # Cells to_numeric rejects fall back to float(), matching parse_amount
+    assert parse_amounts(amounts).tolist() == [1000.5, -12.5, -3.0, 1000.0, 0.0]
@@ -7,6 +7,7 @@ import json
 # Import the modules we'll be testing
 from financial_planning.transaction_processor import TransactionProcessor
 from financial_planning.models import Transaction, Account, Category
+from tests._fixture_data import BASIC_ACCOUNTS, BASIC_CATEGORIES
 
 @pytest.fixture
 def sample_transaction_data():
@@ -17,22 +18,13 @@ def sample_transaction_data():
         'balance': '1000.00'
     }
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_accounts():
-    return {
-        'credit_card': {'name': 'Credit Card', 'type': 'LIABILITY', 'id': '123', 'api_type': 'TRANSACTIONAL'},
-        'debit': {'name': 'Debit Account', 'type': 'ASSET', 'id': '456', 'api_type': 'TRANSACTIONAL'},
-        'expense': {'name': 'Expenses', 'type': 'EXPENSE', 'id': None, 'api_type': None},
-        'income': {'name': 'Income', 'type': 'INCOME', 'id': None, 'api_type': None},
-    }
+    return BASIC_ACCOUNTS
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_categories():
-    return {
-        'income': ['PAYMENT RECEIVED', 'SALARY', 'INCOME'],
-        'groceries': ['WOOLWORTHS', 'COLES', 'IGA'],
-        'dining': ['MCDONALDS', 'SUBWAY', 'RESTAURANT'],
-    }
+    return BASIC_CATEGORIES
 
 def test_parse_date():
     processor = TransactionProcessor()
@@ -126,6 +118,23 @@ def test_update_account_balances(sample_accounts):
     assert processor.account_balances['debit'] == 100.0
     assert processor.account_balances['income'] == 100.0
 
+def test_process_and_balance(sample_accounts, sample_transaction):
+    processor = TransactionProcessor()
+    processor.accounts = sample_accounts
+    processor.raw_transactions = [sample_transaction]
+    
+    processor.process_and_balance()
+    
+    assert len(processor.processed_transactions) == 1
+    assert len(processor.unified_transactions) == 1
+    # Balances are read from the running-balance matrix, for every account
+    assert 'balances' not in processor.unified_transactions[0]
+    assert processor.balances_at(0) == {
+        'credit_card': 0.0, 'debit': 100.0, 'expense': 0.0, 'income': 100.0
+    }
+    assert processor.account_balances['debit'] == 100.0
+    assert processor.account_balances['income'] == 100.0
+
 def test_verify_double_entry_accounting(sample_accounts):
     processor = TransactionProcessor()
     processor.accounts = sample_accounts
@@ -0,0 +1,62 @@
+import json
+import os
+
+from up.transaction_sync import TransactionSync
+
+ACCOUNTS = [
+    {
+        'type': 'accounts',
+        'id': 'acc-1',
+        'attributes': {'displayName': 'Spending', 'accountType': 'TRANSACTIONAL', 'ownershipType': 'INDIVIDUAL'}
+    }
+]
+
+def _transaction(tx_id, created_at):
+    return {
+        'type': 'transactions',
+        'id': tx_id,
+        'attributes': {'createdAt': created_at, 'amount': {'currencyCode': 'AUD', 'value': '-1.00'}},
+        'relationships': {'account': {'data': {'type': 'accounts', 'id': 'acc-1'}}}
+    }
+
+class FakeClient:
+    """Serves a fixed list of transactions newest first, filtered by createdAt like the API"""
+
+    def __init__(self, transactions):
+        self.transactions = transactions
+
+    def list_accounts(self):
+        return {'data': ACCOUNTS}
+
+    def list_transactions(self, since=None):
+        transactions = [tx for tx in self.transactions
+                        if since is None or tx['attributes']['createdAt'] > since]
+        return sorted(transactions, key=lambda tx: tx['attributes']['createdAt'], reverse=True), None
+
+def _stored_ids(storage_dir, filename):
+    with open(os.path.join(storage_dir, filename)) as f:
+        return [tx['id'] for tx in json.load(f)['transactions']]
+
+def test_run_sync_keeps_history_current_every_run(tmp_path):
+    storage_dir = str(tmp_path)
+    t1 = _transaction('t1', '2024-01-01T09:00:00+10:00')
+    t2 = _transaction('t2', '2024-01-02T09:00:00+10:00')
+    t3 = _transaction('t3', '2024-01-03T09:00:00+10:00')
+    t4 = _transaction('t4', '2024-01-04T09:00:00+10:00')
+
+    # Each run gets a fresh instance, as main() does, and only the first run
+    # enriches, since enriched_transactions.json exists after it
+    for transactions, expected in [([t1, t2], ['t2', 't1']),
+                                   ([t1, t2, t3], ['t3', 't2', 't1']),
+                                   ([t1, t2, t3], ['t3', 't2', 't1']),
+                                   ([t1, t2, t3, t4], ['t4', 't3', 't2', 't1'])]:
+        sync = TransactionSync(FakeClient(transactions), storage_dir)
+        assert sync.run_sync()
+        assert _stored_ids(storage_dir, 'all_transactions.json') == expected
+        assert _stored_ids(storage_dir, 'transactions.json') == expected
+        assert [tx['id'] for tx in sync.load_all_transactions()] == expected
+
+    assert sorted(os.listdir(storage_dir)) == [
+        'accounts.json', 'all_transactions.json', 'enriched_all_transactions.json',
+        'enriched_transactions.json', 'sync_state.json', 'transactions.json'
+    ]
@@ -1,6 +1,7 @@
 import os
-import json
+import orjson
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 from up.loggerino import Loggerino
 from up.up_client import UpBankClient
@@ -8,6 +9,33 @@ from dotenv import load_dotenv
 
 logger = Loggerino()
 
+def _dumps(data: Any) -> bytes:
+    """Encode data as JSON bytes, indented by two spaces"""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+def _loads(raw: bytes) -> Any:
+    """Decode JSON bytes, raising orjson.JSONDecodeError if they're malformed"""
+    return orjson.loads(raw)
+
+def _created_at(transaction: Dict) -> str:
+    """Sort key ordering transactions by when they were created"""
+    return transaction["attributes"].get("createdAt", "")
+
+def _merge_newest_first(stored: List[Dict], new: List[Dict]) -> List[Dict]:
+    """
+    Merge new transactions into a stored list kept newest first
+    
+    When every new transaction is newer than the newest stored one they only
+    need sorting among themselves and go in front; otherwise the whole list
+    is re-sorted.
+    """
+    new = sorted(new, key=_created_at, reverse=True)
+    if not stored or not new or _created_at(new[-1]) > _created_at(stored[0]):
+        return new + stored
+    combined = stored + new
+    combined.sort(key=_created_at, reverse=True)
+    return combined
+
 class TransactionSync:
     """Handles syncing and storing Up Bank transactions"""
 
@@ -37,24 +65,54 @@ class TransactionSync:
     
     def _load_json_file(self, filepath: str, default_value: Any = None) -> Any:
         """Load data from a JSON file or return default value if file doesn't exist"""
-        if os.path.exists(filepath):
-            try:
-                with open(filepath, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError as e:
-                logger.error(f"Error decoding JSON from {filepath}: {e}")
-                return default_value if default_value is not None else {}
-        return default_value if default_value is not None else {}
+        # Open directly rather than checking for the file first, so the whole
+        # file comes back from a single read without a separate stat
+        try:
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return default_value if default_value is not None else {}
+        
+        try:
+            return _loads(raw)
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Error decoding JSON from {filepath}: {e}")
+            return default_value if default_value is not None else {}
     
     def _save_json_file(self, filepath: str, data: Any) -> None:
         """Save data to a JSON file"""
         try:
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Encode up front so the file gets one write rather than one per token
+            payload = _dumps(data)
+            if self._file_matches(filepath, payload):
+                logger.debug(f"{filepath} is unchanged, not rewriting it")
+                return
+            # Write alongside and swap in, so a crash mid-write leaves the
+            # previous file intact rather than a truncated one
+            temp_filepath = filepath + ".tmp"
+            with open(temp_filepath, 'wb') as f:
+                f.write(payload)
+            os.replace(temp_filepath, filepath)
         except Exception as e:
             logger.error(f"Error saving data to {filepath}: {e}")
             raise
     
+    def _file_matches(self, filepath: str, payload: bytes) -> bool:
+        """Check whether filepath already holds exactly payload"""
+        # Only a file of the same size can match, so most changed files are
+        # ruled out by the stat without reading them
+        try:
+            if os.stat(filepath).st_size != len(payload):
+                return False
+            with open(filepath, 'rb') as f:
+                return f.read() == payload
+        except OSError:
+            return False
+    
+    def load_all_transactions(self) -> List[Dict]:
+        """Load every transaction ever synced, newest first"""
+        return self._load_json_file(self.all_transactions_file, {"transactions": []}).get("transactions", [])
+    
     def get_last_sync_datetime(self) -> Optional[str]:
         """Get the datetime of the last synced transaction"""
         sync_state = self._load_json_file(self.sync_state_file, {"last_synced": None})
@@ -106,9 +164,6 @@ class TransactionSync:
         existing_data = self._load_json_file(self.transactions_file, {"transactions": []})
         existing_transactions = existing_data.get("transactions", [])
         
-        all_transactions_data = self._load_json_file(self.all_transactions_file, {"transactions": []})
-        all_transactions = all_transactions_data.get("transactions", [])
-        
         since = None if full_sync else self.get_last_sync_datetime()
         
         logger.info(f"Syncing transactions {'(full sync)' if full_sync else f'since {since}'}")
@@ -136,14 +191,7 @@ class TransactionSync:
                 if tx["id"] not in existing_ids
             ]
             
-            combined_transactions = existing_transactions + new_unique_transactions
-            
-            combined_transactions.sort(
-                key=lambda tx: tx["attributes"].get("createdAt", ""), 
-                reverse=True
-            )
-            
-            transactions_to_save = combined_transactions
+            transactions_to_save = _merge_newest_first(existing_transactions, new_unique_transactions)
             new_count = len(new_unique_transactions)
         else:
             transactions_to_save = new_transactions
@@ -154,22 +202,21 @@ class TransactionSync:
             {"transactions": transactions_to_save}
         )
         
+        all_transactions = self.load_all_transactions()
         all_transaction_ids = {tx["id"] for tx in all_transactions}
         
+        unseen_transactions = []
         for transaction in transactions_to_save:
             if transaction["id"] not in all_transaction_ids:
-                all_transactions.append(transaction)
+                unseen_transactions.append(transaction)
                 all_transaction_ids.add(transaction["id"])
         
-        all_transactions.sort(
-            key=lambda tx: tx["attributes"].get("createdAt", ""), 
-            reverse=True
-        )
-        
-        self._save_json_file(
-            self.all_transactions_file, 
-            {"transactions": all_transactions}
-        )
+        if unseen_transactions:
+            all_transactions = _merge_newest_first(all_transactions, unseen_transactions)
+            self._save_json_file(
+                self.all_transactions_file, 
+                {"transactions": all_transactions}
+            )
         
         self.update_last_sync_datetime(most_recent_date)
         
@@ -180,20 +227,36 @@ class TransactionSync:
         """Check if transactions are already enriched"""
         return os.path.exists(self.enriched_transactions_file)
     
-    def enrich_transactions_with_account_data(self) -> None:
-        """Enrich transactions with detailed account information"""
-        logger.info("Enriching transactions with account data")
+    @staticmethod
+    def _enrich_with_account_lookup(transactions: List[Dict], account_lookup: Dict[str, Dict]) -> None:
+        """Attach accountDetails from account_lookup to each transaction in place"""
+        for transaction in transactions:
+            account_relationship = transaction.get("relationships", {}).get("account", {}).get("data", {})
+            if account_relationship:
+                account_details = account_lookup.get(account_relationship.get("id"))
+                if account_details is not None:
+                    transaction["accountDetails"] = account_details
+    
+    def enrich_transactions_with_account_data(self, accounts: Optional[List[Dict]] = None) -> None:
+        """
+        Enrich transactions with detailed account information
         
-        accounts_data = self._load_json_file(self.accounts_file, {"accounts": []})
-        transactions_data = self._load_json_file(self.transactions_file, {"transactions": []})
+        Args:
+            accounts: Accounts just returned by sync_accounts, read from the
+                accounts file when not given
+        """
+        logger.info("Enriching transactions with account data")
         
-        accounts = accounts_data.get("accounts", [])
-        transactions = transactions_data.get("transactions", [])
+        if accounts is None:
+            accounts = self._load_json_file(self.accounts_file, {"accounts": []}).get("accounts", [])
+        transactions = self._load_json_file(self.transactions_file, {"transactions": []}).get("transactions", [])
         
         if not accounts or not transactions:
             logger.warning("No accounts or transactions to enrich")
             return
         
+        # Built once and shared by both lists, so every transaction on an
+        # account points at the same details dict
         account_lookup = {
             account["id"]: {
                 "displayName": account["attributes"].get("displayName"),
@@ -203,32 +266,28 @@ class TransactionSync:
             for account in accounts
         }
         
-        for transaction in transactions:
-            account_relationship = transaction.get("relationships", {}).get("account", {}).get("data", {})
-            if account_relationship and "id" in account_relationship:
-                account_id = account_relationship["id"]
-                if account_id in account_lookup:
-                    transaction["accountDetails"] = account_lookup[account_id]
-        
-        self._save_json_file(self.enriched_transactions_file, {"transactions": transactions})
-        logger.info("Transactions enriched with account data")
+        self._enrich_with_account_lookup(transactions, account_lookup)
         
-        all_transactions_data = self._load_json_file(self.all_transactions_file, {"transactions": []})
-        all_transactions = all_transactions_data.get("transactions", [])
-        
-        if all_transactions:
-            for transaction in all_transactions:
-                account_relationship = transaction.get("relationships", {}).get("account", {}).get("data", {})
-                if account_relationship and "id" in account_relationship:
-                    account_id = account_relationship["id"]
-                    if account_id in account_lookup:
-                        transaction["accountDetails"] = account_lookup[account_id]
+        # The two enriched files are independent, so the recent transactions are
+        # written on a worker while the all-time history is loaded and enriched
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            enriched_saved = executor.submit(self._save_json_file, self.enriched_transactions_file,
+                                             {"transactions": transactions})
             
-            self._save_json_file(
-                os.path.join(self.storage_dir, "enriched_all_transactions.json"), 
-                {"transactions": all_transactions}
-            )
-            logger.info("All transactions history enriched with account data")
+            all_transactions = self.load_all_transactions()
+            
+            if all_transactions:
+                self._enrich_with_account_lookup(all_transactions, account_lookup)
+            
+            enriched_saved.result()
+            logger.info("Transactions enriched with account data")
+            
+            if all_transactions:
+                self._save_json_file(
+                    os.path.join(self.storage_dir, "enriched_all_transactions.json"), 
+                    {"transactions": all_transactions}
+                )
+                logger.info("All transactions history enriched with account data")
     
     def run_sync(self) -> bool:
         """
@@ -242,13 +301,13 @@ class TransactionSync:
             if full_sync:
                 logger.info("No valid last sync found, performing full sync")
             
-            self.sync_accounts()
+            accounts = self.sync_accounts()
             
             self.sync_transactions(full_sync=full_sync)
             
             if not self.is_enriched():
                 logger.info("Transactions not enriched, enriching now")
-                self.enrich_transactions_with_account_data()
+                self.enrich_transactions_with_account_data(accounts or None)
             
             return True
         except Exception as e:
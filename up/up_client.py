@@ -17,6 +17,10 @@ class UpBankClient:
             "Authorization": f"Bearer {api_token}",
             "Accept": "application/json"
         }
+        # One session for every call, so paginated requests reuse the pooled
+        # connection instead of opening a new TCP/TLS connection per page
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
     
     def list_accounts(self, account_type: Optional[str] = None, ownership_type: Optional[str] = None) -> Dict:
         """
@@ -35,9 +39,8 @@ class UpBankClient:
         if ownership_type:
             params["filter[ownershipType]"] = ownership_type
             
-        response = requests.get(
+        response = self.session.get(
             f"{self.BASE_URL}/accounts", 
-            headers=self.headers,
             params=params
         )
         response.raise_for_status()
@@ -53,10 +56,7 @@ class UpBankClient:
         Returns:
             Account data
         """
-        response = requests.get(
-            f"{self.BASE_URL}/accounts/{account_id}",
-            headers=self.headers
-        )
+        response = self.session.get(f"{self.BASE_URL}/accounts/{account_id}")
         response.raise_for_status()
         return response.json()
     
@@ -100,7 +100,7 @@ class UpBankClient:
         
         while next_page:
             logger.debug(f"Fetching transactions from {url} with params {params}")
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self.session.get(url, params=params)
             response.raise_for_status()
             data = response.json()
             
@@ -3,10 +3,17 @@ import argparse
 from datetime import datetime, timedelta
 import calendar
 from collections import defaultdict
+from operator import itemgetter
 import pandas as pd
+import matplotlib
+# Charts are only ever saved to files, so skip probing for a GUI backend
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 from matplotlib.ticker import FuncFormatter
 
+# Shared default for missing nested objects, so lookups don't allocate a dict
+_EMPTY = {}
+
 def load_json_file(filepath):
     try:
         with open(filepath, 'r') as f:
@@ -15,6 +22,13 @@ def load_json_file(filepath):
         print(f"Error loading {filepath}: {str(e)}")
         return None
 
+def load_transaction_frame(filepath):
+    """Load the transactions under 'data' in filepath straight into a report frame"""
+    transaction_data = load_json_file(filepath)
+    if not transaction_data:
+        return None
+    return transactions_to_frame(transaction_data.get('data', []))
+
 def format_currency(value, pos):
     return f"${value:.2f}"
 
@@ -29,69 +43,95 @@ def filter_transactions_by_date(transactions, start_date, end_date):
     start_str = start_date.strftime('%Y-%m-%d')
     end_str = end_date.strftime('%Y-%m-%d')
     for tx in transactions:
-        tx_date = tx.get('attributes', {}).get('settledAt', '').split('T')[0]
+        tx_date = tx.get('attributes', _EMPTY).get('settledAt', '').partition('T')[0]
         if start_str <= tx_date <= end_str:
             filtered.append(tx)
     return filtered
 
 def get_transaction_type(transaction):
-    if 'transferAccount' in transaction.get('relationships', {}):
+    if 'transferAccount' in transaction.get('relationships', _EMPTY):
         return 'transfer'
-    amount = float(transaction.get('attributes', {}).get('amount', {}).get('value', '0'))
+    amount = float(transaction.get('attributes', _EMPTY).get('amount', _EMPTY).get('value', '0'))
     if amount < 0:
         return 'expense'
     else:
         return 'income'
 
+def transactions_to_frame(transactions):
+    """Flatten transactions into one row each of date, amount, category, account and type"""
+    dates, amounts, categories, accounts, transfers = [], [], [], [], []
+    for tx in transactions:
+        attributes = tx.get('attributes', _EMPTY)
+        dates.append(attributes.get('settledAt', '').partition('T')[0])
+        amounts.append(attributes.get('amount', _EMPTY).get('value', '0'))
+        categories.append(attributes.get('category', 'uncategorized'))
+        accounts.append(tx.get('accountDetails', _EMPTY).get('displayName', 'Unknown Account'))
+        transfers.append('transferAccount' in tx.get('relationships', _EMPTY))
+    frame = pd.DataFrame({
+        'date': pd.Series(dates, dtype=object),
+        'amount': pd.Series(amounts, dtype=object).astype(float),
+        'category': pd.Series(categories, dtype=object),
+        'account': pd.Series(accounts, dtype=object),
+        'transfer': pd.Series(transfers, dtype=bool),
+    })
+    frame['type'] = 'income'
+    frame.loc[frame['amount'] < 0, 'type'] = 'expense'
+    frame.loc[frame['transfer'], 'type'] = 'transfer'
+    return frame
+
+def _group_totals(frame, column, values, default_factory):
+    totals = values.groupby(frame[column], sort=False, dropna=False).agg('sum')
+    # Missing keys come back from the groupby as NaN; report them as None again
+    return defaultdict(default_factory, ((None if key != key else key, total) for key, total in totals.items()))
+
 def generate_monthly_summary(transactions, year, month):
+    """Summarise one month, from a list of transactions or a transactions_to_frame result"""
+    frame = transactions if isinstance(transactions, pd.DataFrame) else transactions_to_frame(transactions)
     start_date, end_date = get_month_date_range(year, month)
-    monthly_transactions = filter_transactions_by_date(transactions, start_date, end_date)
+    start_str = start_date.strftime('%Y-%m-%d')
+    end_str = end_date.strftime('%Y-%m-%d')
+    monthly = frame[(frame['date'] >= start_str) & (frame['date'] <= end_str)]
+    income = monthly[monthly['type'] == 'income']
+    expenses = monthly[monthly['type'] == 'expense']
+    volume = monthly['amount'].abs()
     summary = {
         'period': f"{year}-{month:02d}",
-        'start_date': start_date.strftime('%Y-%m-%d'),
-        'end_date': end_date.strftime('%Y-%m-%d'),
-        'total_transactions': len(monthly_transactions),
-        'total_income': 0,
-        'total_expenses': 0,
+        'start_date': start_str,
+        'end_date': end_str,
+        'total_transactions': len(monthly),
+        'total_income': float(income['amount'].sum()),
+        'total_expenses': float(expenses['amount'].abs().sum()),
         'net_cashflow': 0,
-        'income_by_category': defaultdict(float),
-        'expenses_by_category': defaultdict(float),
-        'transactions_by_account': defaultdict(int),
-        'volume_by_account': defaultdict(float)
+        'income_by_category': _group_totals(income, 'category', income['amount'], float),
+        'expenses_by_category': _group_totals(expenses, 'category', expenses['amount'].abs(), float),
+        'transactions_by_account': _group_totals(monthly, 'account', pd.Series(1, index=monthly.index), int),
+        'volume_by_account': _group_totals(monthly, 'account', volume, float)
     }
-    for tx in monthly_transactions:
-        tx_type = get_transaction_type(tx)
-        amount = float(tx.get('attributes', {}).get('amount', {}).get('value', '0'))
-        category = tx.get('attributes', {}).get('category', 'uncategorized')
-        account_name = tx.get('accountDetails', {}).get('displayName', 'Unknown Account')
-        if tx_type == 'income':
-            summary['total_income'] += amount
-            summary['income_by_category'][category] += amount
-        elif tx_type == 'expense':
-            summary['total_expenses'] += abs(amount)
-            summary['expenses_by_category'][category] += abs(amount)
-        summary['transactions_by_account'][account_name] += 1
-        summary['volume_by_account'][account_name] += abs(amount)
     summary['net_cashflow'] = summary['total_income'] - summary['total_expenses']
     return summary
 
 def generate_monthly_report(transactions, year, month):
     summary = generate_monthly_summary(transactions, year, month)
-    print(f"\n===== Monthly Financial Report: {summary['period']} =====")
-    print(f"Period: {summary['start_date']} to {summary['end_date']}")
-    print(f"Total Transactions: {summary['total_transactions']}")
-    print(f"Total Income: ${summary['total_income']:.2f}")
-    print(f"Total Expenses: ${summary['total_expenses']:.2f}")
-    print(f"Net Cash Flow: ${summary['net_cashflow']:.2f}")
-    print("\nIncome by Category:")
-    for category, amount in sorted(summary['income_by_category'].items(), key=lambda x: x[1], reverse=True):
-        print(f"  {category}: ${amount:.2f}")
-    print("\nExpenses by Category:")
-    for category, amount in sorted(summary['expenses_by_category'].items(), key=lambda x: x[1], reverse=True):
-        print(f"  {category}: ${amount:.2f}")
-    print("\nTransactions by Account:")
-    for account, count in sorted(summary['transactions_by_account'].items(), key=lambda x: x[1], reverse=True):
-        print(f"  {account}: {count} transactions, ${summary['volume_by_account'][account]:.2f}")
+    # Lines are collected and printed together rather than one print per row
+    lines = [
+        f"\n===== Monthly Financial Report: {summary['period']} =====",
+        f"Period: {summary['start_date']} to {summary['end_date']}",
+        f"Total Transactions: {summary['total_transactions']}",
+        f"Total Income: ${summary['total_income']:.2f}",
+        f"Total Expenses: ${summary['total_expenses']:.2f}",
+        f"Net Cash Flow: ${summary['net_cashflow']:.2f}",
+        "\nIncome by Category:",
+    ]
+    lines.extend(f"  {category}: ${amount:.2f}"
+                 for category, amount in sorted(summary['income_by_category'].items(), key=itemgetter(1), reverse=True))
+    lines.append("\nExpenses by Category:")
+    lines.extend(f"  {category}: ${amount:.2f}"
+                 for category, amount in sorted(summary['expenses_by_category'].items(), key=itemgetter(1), reverse=True))
+    lines.append("\nTransactions by Account:")
+    volume_by_account = summary['volume_by_account']
+    lines.extend(f"  {account}: {count} transactions, ${volume_by_account[account]:.2f}"
+                 for account, count in sorted(summary['transactions_by_account'].items(), key=itemgetter(1), reverse=True))
+    print("\n".join(lines))
     return summary
 
 def plot_category_breakdown(summary, chart_type='expenses'):
@@ -114,43 +154,48 @@ def plot_category_breakdown(summary, chart_type='expenses'):
     else:
         categories = [cat for cat, _ in sorted_data]
         amounts = [amount for _, amount in sorted_data]
-    plt.figure(figsize=(10, 6))
-    plt.pie(amounts, labels=categories, autopct='%1.1f%%', startangle=90)
-    plt.axis('equal')
-    plt.title(title)
-    plt.tight_layout()
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.pie(amounts, labels=categories, autopct='%1.1f%%', startangle=90)
+    ax.axis('equal')
+    ax.set_title(title)
+    fig.tight_layout()
     filename = f"{chart_type}_breakdown_{summary['period']}.png"
-    plt.savefig(filename)
+    fig.savefig(filename)
     print(f"Saved chart to {filename}")
-    plt.close()
+    plt.close(fig)
 
 def plot_monthly_trend(summaries):
     periods = [s['period'] for s in summaries]
     incomes = [s['total_income'] for s in summaries]
     expenses = [s['total_expenses'] for s in summaries]
     net_flows = [s['net_cashflow'] for s in summaries]
-    plt.figure(figsize=(12, 6))
+    fig, ax = plt.subplots(figsize=(12, 6))
     x = range(len(periods))
     width = 0.35
-    plt.bar([i - width/2 for i in x], incomes, width, label='Income')
-    plt.bar([i + width/2 for i in x], expenses, width, label='Expenses')
-    plt.plot(x, net_flows, 'go-', label='Net Cash Flow')
-    plt.xlabel('Month')
-    plt.ylabel('Amount ($)')
-    plt.title('Monthly Income vs. Expenses')
-    plt.xticks(x, periods)
-    plt.legend()
-    plt.gca().yaxis.set_major_formatter(FuncFormatter(format_currency))
+    ax.bar([i - width/2 for i in x], incomes, width, label='Income')
+    ax.bar([i + width/2 for i in x], expenses, width, label='Expenses')
+    ax.plot(x, net_flows, 'go-', label='Net Cash Flow')
+    ax.set_xlabel('Month')
+    ax.set_ylabel('Amount ($)')
+    ax.set_title('Monthly Income vs. Expenses')
+    ax.set_xticks(x, periods)
+    ax.legend()
+    ax.yaxis.set_major_formatter(FuncFormatter(format_currency))
     filename = "monthly_trend.png"
-    plt.savefig(filename)
+    fig.savefig(filename)
     print(f"Saved trend chart to {filename}")
-    plt.close()
+    plt.close(fig)
 
 def generate_annual_report(transactions, year):
     print(f"\n===== Annual Financial Report: {year} =====")
+    frame = transactions if isinstance(transactions, pd.DataFrame) else transactions_to_frame(transactions)
+    # Bucket rows by their YYYY-MM prefix once; every date in a month's range
+    # shares that prefix, so each summary only scans its own month's rows
+    by_month = dict(tuple(frame.groupby(frame['date'].str[:7], sort=False)))
+    empty = frame.iloc[:0]
     monthly_summaries = []
     for month in range(1, 13):
-        summary = generate_monthly_summary(transactions, year, month)
+        summary = generate_monthly_summary(by_month.get(f"{year}-{month:02d}", empty), year, month)
         monthly_summaries.append(summary)
         print(f"\nMonth: {month:02d}/{year}")
         print(f"  Income: ${summary['total_income']:.2f}")
@@ -167,11 +212,10 @@ def generate_annual_report(transactions, year):
     return monthly_summaries
 
 def main():
-    transaction_data = load_json_file('combined_transactions.json')
-    if not transaction_data:
+    transactions = load_transaction_frame('combined_transactions.json')
+    if transactions is None:
         print("Error: Could not load transaction data")
         return
-    transactions = transaction_data.get('data', [])
     current_year = datetime.now().year
     current_month = datetime.now().month
     summaries = generate_annual_report(transactions, current_year)